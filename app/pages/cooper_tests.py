@@ -3,15 +3,17 @@ Cooper Tests page for Aqualog application.
 Displays Cooper test data and visualizations.
 """
 
+import numpy as np
 import streamlit as st
 import pandas as pd
+import plotly.colors as pc
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, time
 from loguru import logger
 
-from db.queries import get_all_cooper_tests, get_all_members
+from db.queries import get_all_cooper_tests, get_member_names
 
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
@@ -19,11 +21,12 @@ def load_cooper_tests_data():
     """Load Cooper tests data with caching for optimal performance."""
     try:
         tests = get_all_cooper_tests()
-        members = get_all_members()
+        member_names = get_member_names()
         logger.info(
-            f"Successfully loaded {len(tests)} Cooper tests and {len(members)} members"
+            f"Successfully loaded {len(tests)} Cooper tests "
+            f"and {len(member_names)} members"
         )
-        return tests, members
+        return tests, member_names
     except Exception as e:
         logger.error(f"Failed to load Cooper tests data: {e}")
         raise
@@ -53,31 +56,31 @@ def calculate_distance_per_cycle(diving_time_seconds, pool_length):
     return diving_time_seconds * estimated_speed
 
 
-def process_cooper_test_data(tests, members):
+def process_cooper_test_data(tests, member_names):
     """Process Cooper test data for visualization."""
     if not tests:
         return pd.DataFrame()
 
-    # Create member lookup
-    member_lookup = {m.id: f"{m.name} {m.surname}" for m in members}
-
     processed_data = []
 
     for test in tests:
-        member_name = member_lookup.get(test.member_id, f"Member {test.member_id}")
+        member_name = member_names.get(test.member_id, f"Member {test.member_id}")
 
         # Calculate metrics for each cycle
         diving_times = test.diving_times or []
         surface_times = test.surface_times or []
 
-        total_diving_seconds = sum(time_to_seconds(t) for t in diving_times)
-        total_surface_seconds = sum(time_to_seconds(t) for t in surface_times)
-        total_cycles = min(len(diving_times), len(surface_times))
+        # Totals are computed once per test and cached on the model
+        total_diving_seconds = test.total_diving_time_seconds
+        total_surface_seconds = test.total_surface_time_seconds
+        dlen, slen = len(diving_times), len(surface_times)
+        total_cycles = dlen if dlen < slen else slen
 
-        # Calculate average distance (estimation)
-        avg_distance_per_cycle = 0
+        # Calculate averages and estimated distance
+        avg_diving_time = avg_surface_time = avg_distance_per_cycle = 0
         if total_cycles > 0:
             avg_diving_time = total_diving_seconds / total_cycles
+            avg_surface_time = total_surface_seconds / total_cycles
             avg_distance_per_cycle = calculate_distance_per_cycle(
                 avg_diving_time, test.pool_length_meters
             )
@@ -91,12 +94,8 @@ def process_cooper_test_data(tests, members):
                 "total_diving_seconds": total_diving_seconds,
                 "total_surface_seconds": total_surface_seconds,
                 "total_cycles": total_cycles,
-                "avg_diving_time": total_diving_seconds / total_cycles
-                if total_cycles > 0
-                else 0,
-                "avg_surface_time": total_surface_seconds / total_cycles
-                if total_cycles > 0
-                else 0,
+                "avg_diving_time": avg_diving_time,
+                "avg_surface_time": avg_surface_time,
                 "avg_distance_per_cycle": avg_distance_per_cycle,
                 "pool_length": test.pool_length_meters,
                 "diving_times": diving_times,
@@ -271,9 +270,6 @@ def create_parallel_coordinates_chart(df, time_type="diving"):
         # Create parallel coordinates plot
         fig = go.Figure()
 
-        # Use continuous colormap for ordered cycles
-        import plotly.colors as pc
-
         # Generate colors from a continuous colormap (viridis is good for ordered data)
         num_cycles = len(parallel_df)
         if num_cycles > 1:
@@ -354,9 +350,7 @@ def create_diving_vs_surface_chart(df):
     )
 
     # Calculate linear regression statistics for all data
-    import numpy as np
-    from scipy import stats
-    import plotly.graph_objects as go
+    from scipy import stats  # deferred: heavy import only needed for this chart
 
     x = df["avg_diving_time"].values
     y = df["avg_surface_time"].values
@@ -544,6 +538,147 @@ def show_error_fallback():
     """)
 
 
+@st.fragment
+def show_cycle_progression(member_data):
+    """Cycle-by-cycle charts for one member; the time type selector reruns only this."""
+    # Time type selector
+    time_type = st.selectbox(
+        "Select Time Type",
+        options=["diving", "surface"],
+        format_func=lambda x: "Diving Time" if x == "diving" else "Surface Time",
+        help="Choose whether to display diving times or surface times across test dates",
+    )
+
+    # Show parallel coordinates chart
+    parallel_chart = create_parallel_coordinates_chart(member_data, time_type)
+
+    if parallel_chart:
+        st.plotly_chart(parallel_chart)
+        st.caption(
+            f"Each line represents a cycle number, showing how {time_type} times change across test dates. "
+            "This helps identify which cycles improve or decline over time."
+        )
+    else:
+        st.info(
+            "Parallel coordinates chart requires at least 2 test sessions for the selected member."
+        )
+
+    # Show improvement KPIs below the chart if there are at least 2 tests
+    if len(member_data) >= 2:
+        st.markdown(
+            "#### :material/bid_landscape: Performance Improvement (Last Two Tests)"
+        )
+
+        # Sort by test date to get the most recent tests
+        member_data_sorted = member_data.sort_values("test_date")
+        latest_test = member_data_sorted.iloc[-1]
+        previous_test = member_data_sorted.iloc[-2]
+
+        # Calculate median times for each test
+        latest_diving_median = pd.Series(
+            [time_to_seconds(t) for t in latest_test["diving_times"]]
+        ).median()
+        previous_diving_median = pd.Series(
+            [time_to_seconds(t) for t in previous_test["diving_times"]]
+        ).median()
+
+        latest_surface_median = pd.Series(
+            [time_to_seconds(t) for t in latest_test["surface_times"]]
+        ).median()
+        previous_surface_median = pd.Series(
+            [time_to_seconds(t) for t in previous_test["surface_times"]]
+        ).median()
+
+        # Calculate deltas
+        diving_delta = latest_diving_median - previous_diving_median
+        surface_delta = latest_surface_median - previous_surface_median
+
+        # Display improvement metrics
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.metric(
+                label=":material/head_mounted_device: Median Diving Time",
+                value=f"{latest_diving_median:.1f}s",
+                delta=f"{diving_delta:+.1f}s",
+                delta_color="inverse",  # Lower diving time is better, so inverse colors
+                help="Median diving time in the most recent test vs. previous test. Lower is better.",
+            )
+
+        with col2:
+            st.metric(
+                label=":material/pulmonology: Median Surface Time",
+                value=f"{latest_surface_median:.1f}s",
+                delta=f"{surface_delta:+.1f}s",
+                delta_color="inverse",  # Lower surface time is better (faster recovery)
+                help="Median surface time in the most recent test vs. previous test. Lower indicates better recovery.",
+            )
+
+        # Add interpretation
+        if abs(diving_delta) < 1 and abs(surface_delta) < 1:
+            st.info(
+                ":material/lightbulb: Performance is stable - minimal changes between tests."
+            )
+        elif diving_delta < -1 or surface_delta < -1:
+            st.success(
+                ":material/celebration: Great improvement! Times have decreased, indicating better performance."
+            )
+        elif diving_delta > 1 or surface_delta > 1:
+            st.warning(
+                ":material/warning: Performance may have declined. Consider reviewing training approach."
+            )
+
+
+@st.fragment
+def show_test_session_analysis(member_tests):
+    """Cycle patterns of one test session; the session selector reruns only this."""
+    # Select specific test session
+    test_options = []
+    for _, test in member_tests.iterrows():
+        test_options.append(f"{test['test_date']} - {test['total_cycles']} cycles")
+
+    selected_test_idx = st.selectbox(
+        "Select Test Session",
+        options=range(len(test_options)),
+        format_func=lambda x: test_options[x],
+        help="Choose a specific test session to analyze cycle patterns",
+    )
+
+    selected_test_data = member_tests.iloc[selected_test_idx]
+
+    # Show cycle patterns
+    cycle_chart = create_cycle_patterns_chart(selected_test_data)
+    if cycle_chart:
+        st.plotly_chart(cycle_chart)
+
+    # Show detailed metrics for selected test
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric(
+            "Total Diving Time",
+            f"{selected_test_data['total_diving_seconds']:.1f}s",
+        )
+        st.metric(
+            "Average Diving Time",
+            f"{selected_test_data['avg_diving_time']:.1f}s",
+        )
+
+    with col2:
+        st.metric(
+            "Total Surface Time",
+            f"{selected_test_data['total_surface_seconds']:.1f}s",
+        )
+        st.metric(
+            "Average Surface Time",
+            f"{selected_test_data['avg_surface_time']:.1f}s",
+        )
+
+    with col3:
+        st.metric("Total Cycles", int(selected_test_data["total_cycles"]))
+        st.metric("Pool Length", f"{selected_test_data['pool_length']}m")
+
+
 def show_cooper_tests_page():
     """Display the Cooper tests analysis page."""
     st.title(":material/timer: Cooper Tests Analysis")
@@ -551,14 +686,14 @@ def show_cooper_tests_page():
 
     try:
         # Load data with caching
-        tests, members = load_cooper_tests_data()
+        tests, member_names = load_cooper_tests_data()
 
         if not tests:
             show_empty_state()
             return
 
         # Process data for visualization
-        df = process_cooper_test_data(tests, members)
+        df = process_cooper_test_data(tests, member_names)
 
         if df.empty:
             show_empty_state()
@@ -640,96 +775,8 @@ def show_cooper_tests_page():
         if selected_member != "All Members":
             st.markdown("### 🔗 Cycle-by-Cycle Performance Progression")
 
-            # Time type selector
-            time_type = st.selectbox(
-                "Select Time Type",
-                options=["diving", "surface"],
-                format_func=lambda x: "Diving Time"
-                if x == "diving"
-                else "Surface Time",
-                help="Choose whether to display diving times or surface times across test dates",
-            )
-
             member_data = filtered_df[filtered_df["member_name"] == selected_member]
-
-            # Show parallel coordinates chart
-            parallel_chart = create_parallel_coordinates_chart(member_data, time_type)
-
-            if parallel_chart:
-                st.plotly_chart(parallel_chart)
-                st.caption(
-                    f"Each line represents a cycle number, showing how {time_type} times change across test dates. "
-                    "This helps identify which cycles improve or decline over time."
-                )
-            else:
-                st.info(
-                    "Parallel coordinates chart requires at least 2 test sessions for the selected member."
-                )
-
-            # Show improvement KPIs below the chart if there are at least 2 tests
-            if len(member_data) >= 2:
-                st.markdown(
-                    "#### :material/bid_landscape: Performance Improvement (Last Two Tests)"
-                )
-
-                # Sort by test date to get the most recent tests
-                member_data_sorted = member_data.sort_values("test_date")
-                latest_test = member_data_sorted.iloc[-1]
-                previous_test = member_data_sorted.iloc[-2]
-
-                # Calculate median times for each test
-                latest_diving_median = pd.Series(
-                    [time_to_seconds(t) for t in latest_test["diving_times"]]
-                ).median()
-                previous_diving_median = pd.Series(
-                    [time_to_seconds(t) for t in previous_test["diving_times"]]
-                ).median()
-
-                latest_surface_median = pd.Series(
-                    [time_to_seconds(t) for t in latest_test["surface_times"]]
-                ).median()
-                previous_surface_median = pd.Series(
-                    [time_to_seconds(t) for t in previous_test["surface_times"]]
-                ).median()
-
-                # Calculate deltas
-                diving_delta = latest_diving_median - previous_diving_median
-                surface_delta = latest_surface_median - previous_surface_median
-
-                # Display improvement metrics
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    st.metric(
-                        label=":material/head_mounted_device: Median Diving Time",
-                        value=f"{latest_diving_median:.1f}s",
-                        delta=f"{diving_delta:+.1f}s",
-                        delta_color="inverse",  # Lower diving time is better, so inverse colors
-                        help="Median diving time in the most recent test vs. previous test. Lower is better.",
-                    )
-
-                with col2:
-                    st.metric(
-                        label=":material/pulmonology: Median Surface Time",
-                        value=f"{latest_surface_median:.1f}s",
-                        delta=f"{surface_delta:+.1f}s",
-                        delta_color="inverse",  # Lower surface time is better (faster recovery)
-                        help="Median surface time in the most recent test vs. previous test. Lower indicates better recovery.",
-                    )
-
-                # Add interpretation
-                if abs(diving_delta) < 1 and abs(surface_delta) < 1:
-                    st.info(
-                        ":material/lightbulb: Performance is stable - minimal changes between tests."
-                    )
-                elif diving_delta < -1 or surface_delta < -1:
-                    st.success(
-                        ":material/celebration: Great improvement! Times have decreased, indicating better performance."
-                    )
-                elif diving_delta > 1 or surface_delta > 1:
-                    st.warning(
-                        ":material/warning: Performance may have declined. Consider reviewing training approach."
-                    )
+            show_cycle_progression(member_data)
 
         # Diving vs Surface time relationship
         st.divider()
@@ -747,53 +794,7 @@ def show_cooper_tests_page():
             member_tests = filtered_df[filtered_df["member_name"] == selected_member]
 
             if not member_tests.empty:
-                # Select specific test session
-                test_options = []
-                for _, test in member_tests.iterrows():
-                    test_options.append(
-                        f"{test['test_date']} - {test['total_cycles']} cycles"
-                    )
-
-                selected_test_idx = st.selectbox(
-                    "Select Test Session",
-                    options=range(len(test_options)),
-                    format_func=lambda x: test_options[x],
-                    help="Choose a specific test session to analyze cycle patterns",
-                )
-
-                selected_test_data = member_tests.iloc[selected_test_idx]
-
-                # Show cycle patterns
-                cycle_chart = create_cycle_patterns_chart(selected_test_data)
-                if cycle_chart:
-                    st.plotly_chart(cycle_chart)
-
-                # Show detailed metrics for selected test
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.metric(
-                        "Total Diving Time",
-                        f"{selected_test_data['total_diving_seconds']:.1f}s",
-                    )
-                    st.metric(
-                        "Average Diving Time",
-                        f"{selected_test_data['avg_diving_time']:.1f}s",
-                    )
-
-                with col2:
-                    st.metric(
-                        "Total Surface Time",
-                        f"{selected_test_data['total_surface_seconds']:.1f}s",
-                    )
-                    st.metric(
-                        "Average Surface Time",
-                        f"{selected_test_data['avg_surface_time']:.1f}s",
-                    )
-
-                with col3:
-                    st.metric("Total Cycles", int(selected_test_data["total_cycles"]))
-                    st.metric("Pool Length", f"{selected_test_data['pool_length']}m")
+                show_test_session_analysis(member_tests)
 
         # Data table
         st.divider()
@@ -3,6 +3,7 @@ Indoor Trials page for Aqualog application.
 Displays indoor trial data and performance analysis.
 """
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -11,7 +12,7 @@ from plotly.subplots import make_subplots
 from datetime import datetime
 from loguru import logger
 
-from db.queries import get_all_indoor_trials, get_all_members
+from db.queries import get_all_indoor_trials, get_member_names
 
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
@@ -19,24 +20,22 @@ def load_indoor_trials_data():
     """Load indoor trials data with caching for optimal performance."""
     try:
         trials = get_all_indoor_trials()
-        members = get_all_members()
+        member_names = get_member_names()
         logger.info(
-            f"Successfully loaded {len(trials)} indoor trials and {len(members)} members"
+            f"Successfully loaded {len(trials)} indoor trials "
+            f"and {len(member_names)} members"
         )
-        return trials, members
+        return trials, member_names
     except Exception as e:
         logger.error(f"Failed to load indoor trials data: {e}")
         raise
 
 
-def process_indoor_trials_data(trials, members):
+def process_indoor_trials_data(trials, member_names):
     """Convert indoor trials list to formatted pandas DataFrame."""
     if not trials:
         return pd.DataFrame()
 
-    # Create member lookup
-    member_lookup = {m.id: f"{m.name} {m.surname}" for m in members}
-
     # Convert to list of dictionaries for DataFrame
     trials_data = []
     for trial in trials:
@@ -49,7 +48,7 @@ def process_indoor_trials_data(trials, members):
             {
                 "trial_id": trial.id,
                 "member_id": trial.member_id,
-                "member_name": member_lookup.get(
+                "member_name": member_names.get(
                     trial.member_id, f"Member {trial.member_id}"
                 ),
                 "trial_date": trial.trial_date,
@@ -92,8 +91,7 @@ def create_distance_vs_time_chart(df):
     )
 
     # Calculate linear regression statistics for all data
-    import numpy as np
-    from scipy import stats
+    from scipy import stats  # deferred: heavy import only needed for this chart
 
     x = df_with_time["time_seconds"].values
     y = df_with_time["distance_meters"].values
@@ -423,14 +421,14 @@ def show_indoor_trials_page():
 
     try:
         # Load data with caching
-        trials, members = load_indoor_trials_data()
+        trials, member_names = load_indoor_trials_data()
 
         if not trials:
             show_empty_state()
             return
 
         # Process data for visualization
-        df = process_indoor_trials_data(trials, members)
+        df = process_indoor_trials_data(trials, member_names)
 
         if df.empty:
             show_empty_state()
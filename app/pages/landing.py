@@ -114,48 +114,48 @@ def show_landing_page():
     try:
         # Load data with caching
         stats = load_database_statistics()
-
-        # Display KPIs
-        create_kpi_display(stats)
-
-        # Additional insights
-        st.divider()
-        st.subheader(":material/lightbulb: Quick Insights")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            if stats.total_members > 0:
-                avg_tests = stats.total_cooper_tests / stats.total_members
-
-                st.metric(
-                    ":material/bid_landscape: Avg Tests per Member",
-                    f"{avg_tests:.1f}",
-                    help="Average Cooper tests per registered member",
-                )
-            else:
-                st.metric(":material/bid_landscape: Avg Tests per Member", "--")
-
-        with col2:
-            if stats.total_members > 0:
-                avg_trials = stats.total_indoor_trials / stats.total_members
-
-                st.metric(
-                    ":material/target: Avg Trials per Member",
-                    f"{avg_trials:.1f}",
-                    help="Average indoor trials per registered member",
-                )
-            else:
-                st.metric(":material/target: Avg Trials per Member", "--")
-
-        # Total activities summary
-        total_activities = stats.total_cooper_tests + stats.total_indoor_trials
-        st.metric(
-            ":material/trophy: Total Activities",
-            total_activities,
-            help="Combined Cooper tests and indoor trials",
-        )
-
     except Exception as e:
         logger.error(f"Landing page data loading error: {e}")
         show_error_fallback()
+        return
+
+    # Display KPIs
+    create_kpi_display(stats)
+
+    # Additional insights
+    st.divider()
+    st.subheader(":material/lightbulb: Quick Insights")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if stats.total_members > 0:
+            avg_tests = stats.total_cooper_tests / stats.total_members
+
+            st.metric(
+                ":material/bid_landscape: Avg Tests per Member",
+                f"{avg_tests:.1f}",
+                help="Average Cooper tests per registered member",
+            )
+        else:
+            st.metric(":material/bid_landscape: Avg Tests per Member", "--")
+
+    with col2:
+        if stats.total_members > 0:
+            avg_trials = stats.total_indoor_trials / stats.total_members
+
+            st.metric(
+                ":material/target: Avg Trials per Member",
+                f"{avg_trials:.1f}",
+                help="Average indoor trials per registered member",
+            )
+        else:
+            st.metric(":material/target: Avg Trials per Member", "--")
+
+    # Total activities summary
+    total_activities = stats.total_cooper_tests + stats.total_indoor_trials
+    st.metric(
+        ":material/trophy: Total Activities",
+        total_activities,
+        help="Combined Cooper tests and indoor trials",
+    )
@@ -214,60 +214,57 @@ class AuthManager:
         st.caption(FOOTER)
 
 
-# Global authentication manager instance
-auth_manager = AuthManager()
-
-
+@st.cache_resource
 def get_auth_manager() -> AuthManager:
-    """Get the global authentication manager instance."""
-    return auth_manager
+    """Get the authentication manager shared by all sessions of the server."""
+    return AuthManager()
 
 
 def require_authentication() -> bool:
     """Convenience function to require authentication."""
-    return auth_manager.require_authentication()
+    return get_auth_manager().require_authentication()
 
 
 def require_admin() -> bool:
     """Convenience function to require admin privileges."""
-    return auth_manager.require_admin()
+    return get_auth_manager().require_admin()
 
 
 def require_write_access() -> bool:
     """Convenience function to require write access."""
-    return auth_manager.require_write_access()
+    return get_auth_manager().require_write_access()
 
 
 def is_authenticated() -> bool:
     """Convenience function to check authentication status."""
-    return auth_manager.is_authenticated()
+    return get_auth_manager().is_authenticated()
 
 
 def is_admin() -> bool:
     """Convenience function to check admin status."""
-    return auth_manager.is_admin()
+    return get_auth_manager().is_admin()
 
 
 def can_write() -> bool:
     """Convenience function to check write permissions."""
-    return auth_manager.can_write()
+    return get_auth_manager().can_write()
 
 
 def can_read() -> bool:
     """Convenience function to check read permissions."""
-    return auth_manager.can_read()
+    return get_auth_manager().can_read()
 
 
 def get_current_user() -> Optional[DashboardUser]:
     """Convenience function to get current user."""
-    return auth_manager.get_current_user()
+    return get_auth_manager().get_current_user()
 
 
 def get_current_username() -> Optional[str]:
     """Convenience function to get current username."""
-    return auth_manager.get_current_username()
+    return get_auth_manager().get_current_username()
 
 
 def logout() -> None:
     """Convenience function to logout."""
-    auth_manager.logout()
+    get_auth_manager().logout()
@@ -3,6 +3,7 @@ Configuration module for Aqualog application.
 Manages application settings, authentication, and environment variables.
 """
 
+import logging
 import os
 from pathlib import Path
 from typing import Dict, Any
@@ -216,6 +217,12 @@ def create_default_credentials() -> None:
             logger.error(f"Failed to create default credentials: {e}")
 
 
+# Plain record layout shared by the console and file handlers
+LOG_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+)
+
+
 def setup_logging() -> None:
     """Setup logging configuration."""
     config = get_config()
@@ -233,18 +240,27 @@ def setup_logging() -> None:
     logger.add(
         sink=lambda msg: print(msg, end=""),
         level=log_level,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        format=LOG_FORMAT,
+        colorize=False,
     )
 
     # Add file handler
     logger.add(
         sink=log_file,
         level=log_level,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        format=LOG_FORMAT,
+        colorize=False,
         rotation=f"{config.get('logging', 'max_size_mb', 10)} MB",
         retention=config.get("logging", "backup_count", 5),
     )
 
+    # The db layer logs through the standard library
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
     logger.info(f"Logging configured: level={log_level}, file={log_file}")
 
 
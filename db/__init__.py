@@ -15,6 +15,8 @@ from .models import (
     DashboardUser,
 )
 from .queries import (
+    bulk_insert_frames,
+    clear_member_cache,
     get_all_cooper_tests,
     get_all_indoor_trials,
     get_all_members,
@@ -22,15 +24,23 @@ from .queries import (
     get_database_stats,
     get_indoor_trials_by_member,
     get_member_by_id,
+    get_member_names,
     get_performance_trends_cooper,
     get_performance_trends_trials,
     insert_cooper_test,
+    insert_cooper_tests_bulk,
     insert_indoor_trial,
+    insert_indoor_trials_bulk,
     insert_member,
+    insert_members_bulk,
+    iter_all_cooper_tests,
+    iter_all_indoor_trials,
+    iter_all_members,
 )
 from .utils import (
     backup_database,
     clear_all_data,
+    clear_stats_cache,
     export_database_schema,
     get_detailed_stats,
     initialize_database,
@@ -52,14 +62,23 @@ __all__ = [
     # Queries
     "get_all_members",
     "get_member_by_id",
+    "get_member_names",
+    "clear_member_cache",
     "get_all_cooper_tests",
     "get_cooper_tests_by_member",
     "get_all_indoor_trials",
+    "iter_all_members",
+    "iter_all_cooper_tests",
+    "iter_all_indoor_trials",
     "get_indoor_trials_by_member",
     "get_database_stats",
     "insert_member",
     "insert_cooper_test",
     "insert_indoor_trial",
+    "insert_members_bulk",
+    "insert_cooper_tests_bulk",
+    "insert_indoor_trials_bulk",
+    "bulk_insert_frames",
     "get_performance_trends_cooper",
     "get_performance_trends_trials",
     # Utilities
@@ -70,4 +89,5 @@ __all__ = [
     "get_detailed_stats",
     "backup_database",
     "optimize_database",
+    "clear_stats_cache",
 ]
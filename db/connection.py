@@ -1,69 +1,197 @@
 """
-DuckDB connection management with singleton pattern for Aqualog.
+DuckDB connection management for Aqualog, one shared instance per database file.
 Provides centralized database connection handling with automatic initialization.
 """
 
+import atexit
+import contextlib
+import functools
+import hashlib
+import logging
+import os
 import threading
+import time
+import weakref
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar
 
 import duckdb
-from loguru import logger
+
+logger = logging.getLogger(__name__)
+
+# Database file used when no path is given
+DEFAULT_DB_PATH = os.getenv("AQUALOG_DB_PATH", "data/aqualog.duckdb")
+
+# Seconds a measured database file size is reused before stat-ing again
+SIZE_CACHE_TTL = 1.0
+
+# aqualog_meta key holding the SHA-256 of the applied schema.sql
+SCHEMA_FINGERPRINT_KEY = "schema_version"
+
+# Tables loaded into the buffer pool when AQUALOG_PREWARM=1
+PREWARM_TABLES = ("members", "cooper_tests", "indoor_trials")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_schema(path: str) -> str:
+    """Read a schema file once per process."""
+    with open(path) as f:
+        return f.read()
+
+
+class _ThreadCursor:
+    """Holds one thread's cursor in thread-local storage.
+
+    The holder is dropped when its thread ends, which triggers the finalizer
+    ``DatabaseConnection.cursor`` attaches to release the cursor.
+    """
+
+    __slots__ = ("cursor", "in_transaction", "__weakref__")
+
+    def __init__(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        self.cursor = cursor
+        self.in_transaction = False
 
 
 class DatabaseConnection:
-    """Singleton class for managing DuckDB connection."""
-
-    _instance: Optional["DatabaseConnection"] = None
-    _lock = threading.Lock()
-
-    def __new__(cls, db_path: str = "data/aqualog.duckdb") -> "DatabaseConnection":
-        """Create or return existing singleton instance."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self, db_path: str = "data/aqualog.duckdb") -> None:
-        """Initialize the database connection if not already initialized."""
-        if not getattr(self, "_initialized", False):
-            self.db_path = Path(db_path)
-            self._connection: duckdb.DuckDBPyConnection | None = None
-            self._initialized = True
-            logger.info(f"DatabaseConnection initialized with path: {self.db_path}")
+    """Manages the DuckDB connection for one database file.
+
+    Use ``get_db_connection`` to obtain the shared instance for a path.
+    """
+
+    # Database files the schema has already been applied to in this process
+    _schema_initialized: ClassVar[set[Path]] = set()
+
+    # Instances with an open root connection, closed at interpreter exit
+    _open_instances: ClassVar[set["DatabaseConnection"]] = set()
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, read_only: bool = False) -> None:
+        """Initialize the database connection state; connecting is deferred."""
+        self.db_path = Path(db_path)
+        self.read_only = read_only
+        self._db_path_str = str(self.db_path)
+        # (monotonic timestamp, size in MB) of the last size measurement
+        self._size_cache: tuple[float, float] | None = None
+        # One root connection per file; each thread queries through its own cursor
+        self._root: duckdb.DuckDBPyConnection | None = None
+        self._lock = threading.Lock()
+        self._tls = threading.local()
+        # Every live thread cursor, so that close() can close them all
+        self._cursors: list[duckdb.DuckDBPyConnection] = []
+        # Parsed statements keyed by SQL text, reused across calls
+        self._prepared: dict[str, duckdb.Statement | str] = {}
+        logger.info(
+            f"DatabaseConnection initialized with path: {self.db_path}"
+            + (" (read-only)" if read_only else "")
+        )
 
     def connect(self) -> duckdb.DuckDBPyConnection:
-        """Get or create database connection."""
-        if self._connection is None:
-            try:
-                # Ensure the data directory exists
-                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        """Get or create the root database connection."""
+        if self._root is None:
+            with self._lock:
+                if self._root is None:
+                    try:
+                        if self.read_only:
+                            # Read-only connections share the file across processes
+                            # and never create or migrate it
+                            self._root = duckdb.connect(
+                                str(self.db_path), read_only=True
+                            )
+                            logger.info(
+                                f"Connected to DuckDB at {self.db_path} (read-only)"
+                            )
+                        else:
+                            # Ensure the data directory exists
+                            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Create connection to DuckDB file
-                self._connection = duckdb.connect(str(self.db_path))
-                logger.info(f"Connected to DuckDB at {self.db_path}")
+                            # Create connection to DuckDB file
+                            self._root = duckdb.connect(str(self.db_path))
+                            logger.info(f"Connected to DuckDB at {self.db_path}")
 
-                # Initialize database schema
-                self._initialize_schema()
+                            # Initialize database schema
+                            self._initialize_schema()
 
-            except Exception as e:
-                logger.error(f"Failed to connect to database: {e}")
-                raise
+                        self._open_instances.add(self)
+
+                        if os.getenv("AQUALOG_PREWARM") == "1":
+                            self._prewarm()
 
-        return self._connection
+                    except Exception as e:
+                        logger.error(f"Failed to connect to database: {e}")
+                        raise
+
+        return self._root
+
+    def _prewarm(self) -> None:
+        """Load the main tables into DuckDB's buffer pool to cut cold-start latency."""
+        try:
+            self._root.execute("INSTALL cache_prewarm FROM community")
+            self._root.execute("LOAD cache_prewarm")
+            for table in PREWARM_TABLES:
+                self._root.execute(f"SELECT prewarm('{table}', 'buffer', '256MB')")
+            logger.info(f"Prewarmed tables: {', '.join(PREWARM_TABLES)}")
+        except Exception as e:
+            logger.warning(f"Skipping table prewarm: {e}")
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """Get the calling thread's cursor, creating it on first use.
+
+        The cursor is closed when its thread ends, so short-lived threads such
+        as Streamlit reruns do not accumulate cursors.
+        """
+        holder = getattr(self._tls, "holder", None)
+        if holder is None:
+            cursor = self.connect().cursor()
+            holder = _ThreadCursor(cursor)
+            with self._lock:
+                self._cursors.append(cursor)
+            weakref.finalize(holder, self._release_cursor, cursor)
+            self._tls.holder = holder
+        return holder.cursor
+
+    def _release_cursor(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        """Close a thread's cursor once the thread has ended."""
+        with self._lock:
+            try:
+                self._cursors.remove(cursor)
+            except ValueError:
+                # Already closed by close()
+                return
+        cursor.close()
 
     def _initialize_schema(self) -> None:
         """Initialize database schema from SQL file."""
+        resolved_path = self.db_path.resolve()
+        if resolved_path in self._schema_initialized:
+            logger.debug(f"Schema already initialized for {resolved_path}")
+            return
+
         try:
             schema_path = Path(__file__).parent / "schema.sql"
             if schema_path.exists():
-                with open(schema_path) as f:
-                    schema_sql = f.read()
+                schema_sql = _load_schema(str(schema_path))
+                fingerprint = hashlib.sha256(schema_sql.encode()).hexdigest()
+
+                # Skip the DDL when this exact schema was applied before
+                if self._stored_schema_fingerprint() == fingerprint:
+                    self._schema_initialized.add(resolved_path)
+                    logger.debug(f"Schema up to date for {resolved_path}")
+                    return
 
-                # Execute schema creation
-                self._connection.execute(schema_sql)
+                # Execute schema creation as one transaction
+                self._root.execute("BEGIN TRANSACTION")
+                try:
+                    self._root.execute(schema_sql)
+                    self._root.execute(
+                        "INSERT OR REPLACE INTO aqualog_meta VALUES (?, ?)",
+                        (SCHEMA_FINGERPRINT_KEY, fingerprint),
+                    )
+                    self._root.execute("COMMIT")
+                except Exception:
+                    self._root.execute("ROLLBACK")
+                    raise
+                self._schema_initialized.add(resolved_path)
                 logger.info("Database schema initialized successfully")
             else:
                 logger.warning(f"Schema file not found at {schema_path}")
@@ -72,19 +200,53 @@ class DatabaseConnection:
             logger.error(f"Failed to initialize database schema: {e}")
             raise
 
+    def _stored_schema_fingerprint(self) -> str | None:
+        """Return the fingerprint of the schema last applied to this file."""
+        try:
+            row = self._root.execute(
+                "SELECT value FROM aqualog_meta WHERE key = ?",
+                (SCHEMA_FINGERPRINT_KEY,),
+            ).fetchone()
+        except duckdb.CatalogException:
+            # Files created before the metadata table existed
+            return None
+        return row[0] if row else None
+
+    def _prepare(
+        self, conn: duckdb.DuckDBPyConnection, query: str
+    ) -> duckdb.Statement | str:
+        """Return the cached parsed statement for a query, parsing it on first use."""
+        statement = self._prepared.get(query)
+        if statement is None:
+            statements = conn.extract_statements(query)
+            # Multi-statement batches are executed as plain SQL text
+            statement = statements[0] if len(statements) == 1 else query
+            self._prepared[query] = statement
+        return statement
+
     def execute_query(self, query: str, parameters: tuple | None = None):
         """Execute a query with optional parameters."""
         try:
-            conn = self.connect()
+            conn = self.cursor()
+            statement = self._prepare(conn, query)
             if parameters:
-                result = conn.execute(query, parameters)
+                result = conn.execute(statement, parameters)
             else:
-                result = conn.execute(query)
+                result = conn.execute(statement)
             return result
         except Exception as e:
             logger.error(f"Query execution failed: {query[:100]}... Error: {e}")
             raise
 
+    def execute_many(self, query: str, parameters: list[tuple]) -> None:
+        """Execute a query once for each parameter tuple in a single call."""
+        try:
+            conn = self.cursor()
+            conn.executemany(self._prepare(conn, query), parameters)
+        except Exception as e:
+            logger.error(f"Batch execution failed: {query[:100]}... Error: {e}")
+            raise
+
     def fetch_all(self, query: str, parameters: tuple | None = None) -> list:
         """Execute query and fetch all results."""
         result = self.execute_query(query, parameters)
@@ -95,29 +257,136 @@ class DatabaseConnection:
         result = self.execute_query(query, parameters)
         return result.fetchone()
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Run the enclosed statements in one transaction on this thread's cursor.
+
+        Commits when the block exits normally and rolls back if it raises
+        anything, including KeyboardInterrupt or the GeneratorExit of an
+        abandoned generator. Use it around a loop of single-row inserts to commit
+        once instead of per row.
+
+        Transactions do not nest: DuckDB has no savepoints, so entering one while
+        this thread's cursor is already in a transaction raises RuntimeError.
+        """
+        conn = self.cursor()
+        holder = self._tls.holder
+        if holder.in_transaction:
+            raise RuntimeError("Nested transactions are not supported")
+
+        conn.execute("BEGIN TRANSACTION")
+        holder.in_transaction = True
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            holder.in_transaction = False
+
+    @contextlib.contextmanager
+    def exclusive_checkpoint(self) -> Iterator[bool]:
+        """Checkpoint the database and keep other writers out for the block.
+
+        Yields True once the WAL is folded into the database file, which then
+        stays unchanged until the block exits. DuckDB's file lock keeps other
+        processes from writing while this one holds the read-write connection.
+        No other thread of this process has a cursor, and none can get one
+        until the block exits. Yields False, without checkpointing, when that
+        cannot be guaranteed: on read-only connections, while other threads hold
+        cursors, or inside a transaction.
+        """
+        if self.read_only:
+            yield False
+            return
+
+        conn = self.cursor()
+        with self._lock:
+            exclusive = not self._tls.holder.in_transaction and all(
+                other is conn for other in self._cursors
+            )
+            if exclusive:
+                conn.execute("CHECKPOINT")
+                yield True
+                return
+        yield False
+
+    def iter_chunks(
+        self, query: str, parameters: tuple | None = None, chunk_size: int = 1000
+    ) -> Iterator[list[tuple]]:
+        """Execute query and yield its rows ``chunk_size`` at a time.
+
+        The query runs on a dedicated cursor, so other queries issued by the
+        consumer on the same thread do not disturb the pending result.
+        """
+        cursor = self.connect().cursor()
+        try:
+            cursor.execute(query, parameters)
+            while rows := cursor.fetchmany(chunk_size):
+                yield rows
+        finally:
+            cursor.close()
+
     def close(self) -> None:
-        """Close database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close all thread cursors and the root database connection."""
+        if self._root:
+            with self._lock:
+                cursors, self._cursors = self._cursors, []
+                # Dropping the old thread-local storage runs the cursor finalizers;
+                # do it outside the lock, where they find nothing left to release
+                old_tls, self._tls = self._tls, threading.local()
+                root, self._root = self._root, None
+                self._open_instances.discard(self)
+            for cursor in cursors:
+                cursor.close()
+            root.close()
+            del old_tls
+            self._prepared.clear()
+            self._size_cache = None
             logger.info("Database connection closed")
 
     def get_database_size(self) -> float:
-        """Get database file size in MB."""
-        try:
-            if self.db_path.exists():
-                size_bytes = self.db_path.stat().st_size
-                return size_bytes / (1024 * 1024)  # Convert to MB
-            return 0.0
-        except Exception as e:
-            logger.error(f"Failed to get database size: {e}")
-            return 0.0
+        """Get database size in MB including the WAL, cached for up to a second."""
+        now = time.monotonic()
+        if self._size_cache is not None and now - self._size_cache[0] < SIZE_CACHE_TTL:
+            return self._size_cache[1]
 
+        size_bytes = 0
+        for path in (self._db_path_str, self._db_path_str + ".wal"):
+            try:
+                size_bytes += os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"Failed to get database size: {e}")
+                return 0.0
 
-# Global database instance
-db = DatabaseConnection()
+        size_mb = size_bytes / (1024 * 1024)  # Convert to MB
+        self._size_cache = (now, size_mb)
+        return size_mb
 
 
-def get_db_connection() -> DatabaseConnection:
-    """Get the global database connection instance."""
-    return db
+@atexit.register
+def _close_open_connections() -> None:
+    """Close connections still open at exit so DuckDB checkpoints the WAL."""
+    for connection in list(DatabaseConnection._open_instances):
+        connection.close()
+
+
+@functools.cache
+def _get_db(db_path: str, read_only: bool) -> DatabaseConnection:
+    """Create the shared instance for a path and mode, once per process."""
+    return DatabaseConnection(db_path, read_only)
+
+
+def get_db_connection(
+    db_path: str | None = None, read_only: bool = False
+) -> DatabaseConnection:
+    """Get the shared database connection instance for a path and mode."""
+    return _get_db(db_path or DEFAULT_DB_PATH, read_only)
+
+
+# Global database instance
+db = get_db_connection()
@@ -3,12 +3,44 @@ Data models for Aqualog freediving management system.
 Defines dataclasses for type safety and data validation.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, time
-from typing import List, Optional
+from operator import attrgetter, mul
+from typing import TYPE_CHECKING, List, Optional
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+# Cycle count from which time sums are vectorized with NumPy
+_VECTORIZE_MIN_TIMES = 64
+
+# TIME components and their weight in microseconds
+_time_fields = attrgetter("hour", "minute", "second", "microsecond")
+_TIME_WEIGHTS = (3_600_000_000, 60_000_000, 1_000_000, 1)
+
+
+def _sum_times_seconds(times: list[time]) -> float:
+    """Sum a list of TIME values as seconds, in integer microseconds."""
+    if not times:
+        return 0.0
+
+    if len(times) < _VECTORIZE_MIN_TIMES:
+        # Sum each component across all times, then weight the four totals
+        totals = map(sum, zip(*map(_time_fields, times), strict=True))
+        return sum(map(mul, totals, _TIME_WEIGHTS)) / 1_000_000
+
+    # Imported here so that loading the models does not pull in NumPy
+    import numpy as np
+
+    components = np.fromiter(
+        (v for t in times for v in _time_fields(t)),
+        dtype=np.int64,
+        count=4 * len(times),
+    ).reshape(-1, 4)
+    return int(components.sum(axis=0) @ np.array(_TIME_WEIGHTS)) / 1_000_000
+
+
+@dataclass(slots=True)
 class Member:
     """Represents a freediving society member."""
 
@@ -39,7 +71,7 @@ class Member:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CooperTest:
     """Represents a 12-minute Cooper test session with diving/surface cycles."""
 
@@ -51,6 +83,13 @@ class CooperTest:
     pool_length_meters: int  # Swimming pool length (e.g., 25m, 50m)
     notes: str | None
     created_at: datetime
+    # Memoized time totals; the cycle time lists are not modified after loading
+    _diving_seconds: float | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _surface_seconds: float | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def total_cycles(self) -> int:
@@ -60,18 +99,16 @@ class CooperTest:
     @property
     def total_diving_time_seconds(self) -> float:
         """Calculate total diving time in seconds."""
-        return sum(
-            t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1_000_000
-            for t in self.diving_times
-        )
+        if self._diving_seconds is None:
+            self._diving_seconds = _sum_times_seconds(self.diving_times)
+        return self._diving_seconds
 
     @property
     def total_surface_time_seconds(self) -> float:
         """Calculate total surface time in seconds."""
-        return sum(
-            t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1_000_000
-            for t in self.surface_times
-        )
+        if self._surface_seconds is None:
+            self._surface_seconds = _sum_times_seconds(self.surface_times)
+        return self._surface_seconds
 
     @property
     def average_diving_time_seconds(self) -> float:
@@ -89,7 +126,7 @@ class CooperTest:
         return self.total_diving_time_seconds * avg_speed_mps
 
 
-@dataclass
+@dataclass(slots=True)
 class IndoorTrial:
     """Represents an indoor training trial session."""
 
@@ -122,7 +159,7 @@ class IndoorTrial:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseStats:
     """Represents database statistics for dashboard display."""
 
@@ -137,14 +174,17 @@ class DatabaseStats:
         return self.total_cooper_tests + self.total_indoor_trials
 
 
-@dataclass
+# Arrays have no single truth value, so trends compare by identity
+@dataclass(slots=True, eq=False)
 class PerformanceTrend:
     """Represents performance trend data for visualizations."""
 
     member_name: str
     dates: list[date]
-    values: list[float]
+    values: "np.ndarray"  # float64, one value per date
     metric_type: str  # e.g., "distance", "diving_time", "cycles"
+    # Memoized improvement_trend result for trends with at least two values
+    _trend: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def data_points(self) -> int:
@@ -154,26 +194,32 @@ class PerformanceTrend:
     @property
     def latest_value(self) -> float | None:
         """Get the most recent performance value."""
-        return self.values[-1] if self.values else None
+        return float(self.values[-1]) if len(self.values) else None
 
     @property
     def improvement_trend(self) -> str | None:
         """Determine if performance is improving, declining, or stable."""
         if len(self.values) < 2:
             return None
-
-        recent_avg = sum(self.values[-3:]) / min(3, len(self.values))
-        older_avg = sum(self.values[:3]) / min(3, len(self.values))
-
-        if recent_avg > older_avg * 1.05:  # 5% improvement threshold
-            return "improving"
-        elif recent_avg < older_avg * 0.95:  # 5% decline threshold
-            return "declining"
+        if self._trend is not None:
+            return self._trend
+
+        # Both windows hold the same number of values, so comparing their sums
+        # is equivalent to comparing their averages
+        window = min(3, len(self.values))
+        recent_total = self.values[-window:].sum()
+        older_total = self.values[:window].sum()
+
+        if recent_total > older_total * 1.05:  # 5% improvement threshold
+            self._trend = "improving"
+        elif recent_total < older_total * 0.95:  # 5% decline threshold
+            self._trend = "declining"
         else:
-            return "stable"
+            self._trend = "stable"
+        return self._trend
 
 
-@dataclass
+@dataclass(slots=True)
 class DashboardUser:
     """Represents a dashboard user with authentication and role information."""
 
@@ -3,116 +3,178 @@ Centralized query functions for Aqualog database operations.
 Provides type-safe database access with proper error handling.
 """
 
+import dataclasses
+import logging
+from collections.abc import Iterator
 from datetime import date, time
+from itertools import starmap
+from operator import itemgetter
+from pathlib import Path
+from time import monotonic
+from typing import TYPE_CHECKING
 
-from loguru import logger
+import duckdb
 
-from .connection import get_db_connection
+from .connection import DatabaseConnection, get_db_connection
 from .models import CooperTest, DatabaseStats, IndoorTrial, Member, PerformanceTrend
+from .utils import clear_stats_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Seconds a member lookup is reused before querying again
+MEMBER_CACHE_TTL = 60.0
+
+# Most members kept by get_member_by_id
+MEMBER_CACHE_SIZE = 2048
+
+# (database path, member ID) -> (monotonic time fetched, member)
+_member_cache: dict[tuple[Path, int], tuple[float, Member]] = {}
+
+# Cooper test columns around the two time arrays, in field order
+_cooper_head = itemgetter(0, 1, 2)
+_cooper_tail = itemgetter(5, 6, 7)
+
+
+def _cooper_tests_from_rows(rows: list[tuple]) -> list[CooperTest]:
+    """Build Cooper tests from selected rows; NULL arrays become empty lists."""
+    make_test = CooperTest
+    return [
+        make_test(*_cooper_head(r), r[3] or [], r[4] or [], *_cooper_tail(r))
+        for r in rows
+    ]
+
+
+def iter_all_members(chunk_size: int = 1000) -> Iterator[Member]:
+    """Stream all members, fetching ``chunk_size`` rows at a time."""
+    db = get_db_connection()
+    query = """
+    SELECT id, name, surname, date_of_birth, contact_info,
+           membership_start_date, created_at
+    FROM members
+    ORDER BY surname, name
+    """
+
+    for rows in db.iter_chunks(query, chunk_size=chunk_size):
+        # Columns are selected in field order
+        yield from starmap(Member, rows)
 
 
 def get_all_members() -> list[Member]:
     """Retrieve all members from the database."""
     try:
-        db = get_db_connection()
-        query = """
-        SELECT id, name, surname, date_of_birth, contact_info,
-               membership_start_date, created_at
-        FROM members
-        ORDER BY surname, name
-        """
-
-        rows = db.fetch_all(query)
-        members = []
-
-        for row in rows:
-            member = Member(
-                id=row[0],
-                name=row[1],
-                surname=row[2],
-                date_of_birth=row[3],
-                contact_info=row[4],
-                membership_start_date=row[5],
-                created_at=row[6],
-            )
-            members.append(member)
+        members = list(iter_all_members())
 
         logger.info(f"Retrieved {len(members)} members from database")
         return members
 
-    except Exception as e:
+    except duckdb.Error as e:
         logger.error(f"Failed to retrieve members: {e}")
         return []
 
 
-def get_member_by_id(member_id: int) -> Member | None:
-    """Retrieve a specific member by ID."""
+def get_member_names(db: DatabaseConnection | None = None) -> dict[int, str]:
+    """Map member IDs to full names, selecting only the name columns."""
     try:
-        db = get_db_connection()
-        query = """
-        SELECT id, name, surname, date_of_birth, contact_info,
-               membership_start_date, created_at
-        FROM members
-        WHERE id = ?
-        """
-
-        row = db.fetch_one(query, (member_id,))
-        if row:
-            return Member(
-                id=row[0],
-                name=row[1],
-                surname=row[2],
-                date_of_birth=row[3],
-                contact_info=row[4],
-                membership_start_date=row[5],
-                created_at=row[6],
-            )
+        db = db or get_db_connection()
+        rows = db.fetch_all("SELECT id, name || ' ' || surname FROM members")
+        names = dict(rows)
+
+        logger.info(f"Retrieved {len(names)} member names from database")
+        return names
+
+    except duckdb.Error as e:
+        logger.error(f"Failed to retrieve member names: {e}")
+        return {}
+
+
+def _load_member(member_id: int) -> Member | None:
+    """Fetch one member; errors propagate so that they are not cached."""
+    db = get_db_connection()
+    key = (db.db_path, member_id)
+
+    now = monotonic()
+    cached = _member_cache.get(key)
+    if cached is not None and now - cached[0] < MEMBER_CACHE_TTL:
+        return cached[1]
+
+    query = """
+    SELECT id, name, surname, date_of_birth, contact_info,
+           membership_start_date, created_at
+    FROM members
+    WHERE id = ?
+    """
+
+    row = db.fetch_one(query, (member_id,))
+    if row is None:
+        # Misses are not cached: the member may be inserted at any time
+        _member_cache.pop(key, None)
         return None
 
-    except Exception as e:
+    member = Member(*row)
+    if len(_member_cache) >= MEMBER_CACHE_SIZE:
+        # Evict the oldest entry; dicts keep insertion order
+        _member_cache.pop(next(iter(_member_cache)), None)
+    _member_cache[key] = (now, member)
+    return member
+
+
+def clear_member_cache() -> None:
+    """Drop cached members; call after members are inserted, changed or deleted."""
+    _member_cache.clear()
+
+
+def get_member_by_id(member_id: int) -> Member | None:
+    """Retrieve a specific member by ID.
+
+    Lookups are memoized per database for ``MEMBER_CACHE_TTL`` seconds, which
+    bounds how stale a member changed by another process can be. Each caller
+    gets its own copy, so mutating it does not affect the cache.
+    """
+    try:
+        member = _load_member(member_id)
+        return dataclasses.replace(member) if member is not None else None
+
+    except duckdb.Error as e:
         logger.error(f"Failed to retrieve member {member_id}: {e}")
         return None
 
 
+def iter_all_cooper_tests(chunk_size: int = 1000) -> Iterator[CooperTest]:
+    """Stream all Cooper tests, fetching ``chunk_size`` rows at a time."""
+    db = get_db_connection()
+    query = """
+    SELECT id, member_id, test_date, diving_times, surface_times,
+           pool_length_meters, notes, created_at
+    FROM cooper_tests
+    ORDER BY test_date DESC, member_id
+    """
+
+    for rows in db.iter_chunks(query, chunk_size=chunk_size):
+        yield from _cooper_tests_from_rows(rows)
+
+
 def get_all_cooper_tests() -> list[CooperTest]:
     """Retrieve all Cooper tests from the database."""
     try:
-        db = get_db_connection()
-        query = """
-        SELECT id, member_id, test_date, diving_times, surface_times,
-               pool_length_meters, notes, created_at
-        FROM cooper_tests
-        ORDER BY test_date DESC, member_id
-        """
-
-        rows = db.fetch_all(query)
-        tests = []
-
-        for row in rows:
-            test = CooperTest(
-                id=row[0],
-                member_id=row[1],
-                test_date=row[2],
-                diving_times=row[3] if row[3] else [],
-                surface_times=row[4] if row[4] else [],
-                pool_length_meters=row[5],
-                notes=row[6],
-                created_at=row[7],
-            )
-            tests.append(test)
+        tests = list(iter_all_cooper_tests())
 
         logger.info(f"Retrieved {len(tests)} Cooper tests from database")
         return tests
 
-    except Exception as e:
+    except duckdb.Error as e:
         logger.error(f"Failed to retrieve Cooper tests: {e}")
         return []
 
 
-def get_cooper_tests_by_member(member_id: int) -> list[CooperTest]:
+def get_cooper_tests_by_member(
+    member_id: int, db: DatabaseConnection | None = None
+) -> list[CooperTest]:
     """Retrieve Cooper tests for a specific member."""
     try:
-        db = get_db_connection()
+        db = db or get_db_connection()
         query = """
         SELECT id, member_id, test_date, diving_times, surface_times,
                pool_length_meters, notes, created_at
@@ -122,68 +184,50 @@ def get_cooper_tests_by_member(member_id: int) -> list[CooperTest]:
         """
 
         rows = db.fetch_all(query, (member_id,))
-        tests = []
-
-        for row in rows:
-            test = CooperTest(
-                id=row[0],
-                member_id=row[1],
-                test_date=row[2],
-                diving_times=row[3] if row[3] else [],
-                surface_times=row[4] if row[4] else [],
-                pool_length_meters=row[5],
-                notes=row[6],
-                created_at=row[7],
-            )
-            tests.append(test)
+        tests = _cooper_tests_from_rows(rows)
 
         logger.info(f"Retrieved {len(tests)} Cooper tests for member {member_id}")
         return tests
 
-    except Exception as e:
+    except duckdb.Error as e:
         logger.error(f"Failed to retrieve Cooper tests for member {member_id}: {e}")
         return []
 
 
+def iter_all_indoor_trials(chunk_size: int = 1000) -> Iterator[IndoorTrial]:
+    """Stream all indoor trials, fetching ``chunk_size`` rows at a time."""
+    db = get_db_connection()
+    query = """
+    SELECT id, member_id, trial_date, location, distance_meters,
+           time_seconds, pool_length_meters, created_at
+    FROM indoor_trials
+    ORDER BY trial_date DESC, member_id
+    """
+
+    for rows in db.iter_chunks(query, chunk_size=chunk_size):
+        # Columns are selected in field order
+        yield from starmap(IndoorTrial, rows)
+
+
 def get_all_indoor_trials() -> list[IndoorTrial]:
     """Retrieve all indoor trials from the database."""
     try:
-        db = get_db_connection()
-        query = """
-        SELECT id, member_id, trial_date, location, distance_meters,
-               time_seconds, pool_length_meters, created_at
-        FROM indoor_trials
-        ORDER BY trial_date DESC, member_id
-        """
-
-        rows = db.fetch_all(query)
-        trials = []
-
-        for row in rows:
-            trial = IndoorTrial(
-                id=row[0],
-                member_id=row[1],
-                trial_date=row[2],
-                location=row[3],
-                distance_meters=row[4],
-                time_seconds=row[5],
-                pool_length_meters=row[6],
-                created_at=row[7],
-            )
-            trials.append(trial)
+        trials = list(iter_all_indoor_trials())
 
         logger.info(f"Retrieved {len(trials)} indoor trials from database")
         return trials
 
-    except Exception as e:
+    except duckdb.Error as e:
         logger.error(f"Failed to retrieve indoor trials: {e}")
         return []
 
 
-def get_indoor_trials_by_member(member_id: int) -> list[IndoorTrial]:
+def get_indoor_trials_by_member(
+    member_id: int, db: DatabaseConnection | None = None
+) -> list[IndoorTrial]:
     """Retrieve indoor trials for a specific member."""
     try:
-        db = get_db_connection()
+        db = db or get_db_connection()
         query = """
         SELECT id, member_id, trial_date, location, distance_meters,
                time_seconds, pool_length_meters, created_at
@@ -193,42 +237,30 @@ def get_indoor_trials_by_member(member_id: int) -> list[IndoorTrial]:
         """
 
         rows = db.fetch_all(query, (member_id,))
-        trials = []
-
-        for row in rows:
-            trial = IndoorTrial(
-                id=row[0],
-                member_id=row[1],
-                trial_date=row[2],
-                location=row[3],
-                distance_meters=row[4],
-                time_seconds=row[5],
-                pool_length_meters=row[6],
-                created_at=row[7],
-            )
-            trials.append(trial)
+        # Columns are selected in field order
+        trials = list(starmap(IndoorTrial, rows))
 
         logger.info(f"Retrieved {len(trials)} indoor trials for member {member_id}")
         return trials
 
-    except Exception as e:
+    except duckdb.Error as e:
         logger.error(f"Failed to retrieve indoor trials for member {member_id}: {e}")
         return []
 
 
-def get_database_stats() -> DatabaseStats:
+def get_database_stats(db: DatabaseConnection | None = None) -> DatabaseStats:
     """Get database statistics for dashboard display."""
     try:
-        db = get_db_connection()
-
-        # Count members
-        members_count = db.fetch_one("SELECT COUNT(*) FROM members")[0]
-
-        # Count Cooper tests
-        cooper_tests_count = db.fetch_one("SELECT COUNT(*) FROM cooper_tests")[0]
+        db = db or get_db_connection()
 
-        # Count indoor trials
-        indoor_trials_count = db.fetch_one("SELECT COUNT(*) FROM indoor_trials")[0]
+        # Count all three tables in a single round trip
+        members_count, cooper_tests_count, indoor_trials_count = db.fetch_one(
+            """
+            SELECT (SELECT COUNT(*) FROM members),
+                   (SELECT COUNT(*) FROM cooper_tests),
+                   (SELECT COUNT(*) FROM indoor_trials)
+            """
+        )
 
         # Get database file size
         db_size_mb = db.get_database_size()
@@ -243,7 +275,7 @@ def get_database_stats() -> DatabaseStats:
         logger.info(f"Retrieved database stats: {stats}")
         return stats
 
-    except Exception as e:
+    except duckdb.Error as e:
         logger.error(f"Failed to retrieve database stats: {e}")
         return DatabaseStats(
             total_members=0,
@@ -259,10 +291,11 @@ def insert_member(
     date_of_birth: date,
     contact_info: str | None,
     membership_start_date: date,
+    db: DatabaseConnection | None = None,
 ) -> int:
     """Insert a new member and return the member ID."""
     try:
-        db = get_db_connection()
+        db = db or get_db_connection()
         # Get next ID
         max_id_result = db.fetch_one("SELECT COALESCE(MAX(id), 0) + 1 FROM members")
         member_id = max_id_result[0]
@@ -284,6 +317,8 @@ def insert_member(
             ),
         )
 
+        clear_member_cache()
+        clear_stats_cache()
         logger.info(f"Inserted new member: {name} {surname} (ID: {member_id})")
         return member_id
 
@@ -299,10 +334,11 @@ def insert_cooper_test(
     surface_times: list[time],
     pool_length_meters: int,
     notes: str | None = None,
+    db: DatabaseConnection | None = None,
 ) -> int:
     """Insert a new Cooper test and return the test ID."""
     try:
-        db = get_db_connection()
+        db = db or get_db_connection()
         # Get next ID
         max_id_result = db.fetch_one(
             "SELECT COALESCE(MAX(id), 0) + 1 FROM cooper_tests"
@@ -328,6 +364,7 @@ def insert_cooper_test(
             ),
         )
 
+        clear_stats_cache()
         logger.info(f"Inserted Cooper test for member {member_id} (Test ID: {test_id})")
         return test_id
 
@@ -343,10 +380,11 @@ def insert_indoor_trial(
     distance_meters: int,
     time_seconds: int | None,
     pool_length_meters: int,
+    db: DatabaseConnection | None = None,
 ) -> int:
     """Insert a new indoor trial and return the trial ID."""
     try:
-        db = get_db_connection()
+        db = db or get_db_connection()
         # Get next ID
         max_id_result = db.fetch_one(
             "SELECT COALESCE(MAX(id), 0) + 1 FROM indoor_trials"
@@ -372,6 +410,7 @@ def insert_indoor_trial(
             ),
         )
 
+        clear_stats_cache()
         logger.info(
             f"Inserted indoor trial for member {member_id} (Trial ID: {trial_id})"
         )
@@ -382,97 +421,258 @@ def insert_indoor_trial(
         raise
 
 
+def _insert_bulk(table: str, columns: str, records: list[tuple]) -> list[int]:
+    """Insert records with sequential IDs after the current maximum, atomically."""
+    if not records:
+        return []
+
+    db = get_db_connection()
+    placeholders = ", ".join("?" * (columns.count(",") + 2))
+    query = f"INSERT INTO {table} (id, {columns}) VALUES ({placeholders})"
+
+    with db.transaction():
+        base = db.fetch_one(f"SELECT COALESCE(MAX(id), 0) FROM {table}")[0]
+        ids = list(range(base + 1, base + 1 + len(records)))
+        db.execute_many(query, [(i, *rec) for i, rec in zip(ids, records, strict=True)])
+
+    clear_stats_cache()
+    return ids
+
+
+def insert_members_bulk(records: list[tuple]) -> list[int]:
+    """
+    Insert many members and return their IDs.
+
+    Each record is ``(name, surname, date_of_birth, contact_info,
+    membership_start_date)``, the argument order of ``insert_member``.
+    """
+    try:
+        ids = _insert_bulk(
+            "members",
+            "name, surname, date_of_birth, contact_info, membership_start_date",
+            records,
+        )
+        clear_member_cache()
+        logger.info(f"Inserted {len(ids)} members")
+        return ids
+
+    except Exception as e:
+        logger.error(f"Failed to bulk insert members: {e}")
+        raise
+
+
+def insert_cooper_tests_bulk(records: list[tuple]) -> list[int]:
+    """
+    Insert many Cooper tests and return their IDs.
+
+    Each record is ``(member_id, test_date, diving_times, surface_times,
+    pool_length_meters, notes)``, the argument order of ``insert_cooper_test``.
+    """
+    try:
+        ids = _insert_bulk(
+            "cooper_tests",
+            "member_id, test_date, diving_times, surface_times, "
+            "pool_length_meters, notes",
+            records,
+        )
+        logger.info(f"Inserted {len(ids)} Cooper tests")
+        return ids
+
+    except Exception as e:
+        logger.error(f"Failed to bulk insert Cooper tests: {e}")
+        raise
+
+
+def insert_indoor_trials_bulk(records: list[tuple]) -> list[int]:
+    """
+    Insert many indoor trials and return their IDs.
+
+    Each record is ``(member_id, trial_date, location, distance_meters,
+    time_seconds, pool_length_meters)``, the argument order of
+    ``insert_indoor_trial``.
+    """
+    try:
+        ids = _insert_bulk(
+            "indoor_trials",
+            "member_id, trial_date, location, distance_meters, time_seconds, "
+            "pool_length_meters",
+            records,
+        )
+        logger.info(f"Inserted {len(ids)} indoor trials")
+        return ids
+
+    except Exception as e:
+        logger.error(f"Failed to bulk insert indoor trials: {e}")
+        raise
+
+
+def bulk_insert_frames(
+    members: "pd.DataFrame",
+    cooper_tests: "pd.DataFrame",
+    indoor_trials: "pd.DataFrame",
+) -> tuple[int, int, int]:
+    """
+    Insert generated DataFrames in one transaction and return the row counts.
+
+    ``members.id`` and the ``member_id`` columns hold local keys starting at 1,
+    which are offset past the current maximum member ID. Test and trial IDs are
+    assigned sequentially after the current maximum of each table, in frame
+    order.
+    """
+    db = get_db_connection()
+    conn = db.cursor()
+
+    try:
+        conn.register("members_frame", members)
+        # DuckDB may scan a frame in parallel, so number rows by position
+        conn.register(
+            "cooper_tests_frame", cooper_tests.assign(_row=range(len(cooper_tests)))
+        )
+        conn.register(
+            "indoor_trials_frame", indoor_trials.assign(_row=range(len(indoor_trials)))
+        )
+
+        with db.transaction():
+            member_base = conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM members"
+            ).fetchone()[0]
+
+            conn.execute(
+                """
+                INSERT INTO members (id, name, surname, date_of_birth, contact_info,
+                                     membership_start_date)
+                SELECT ? + id, name, surname, date_of_birth, contact_info,
+                       membership_start_date
+                FROM members_frame
+                """,
+                (member_base,),
+            )
+            conn.execute(
+                """
+                INSERT INTO cooper_tests (id, member_id, test_date, diving_times,
+                                          surface_times, pool_length_meters, notes)
+                SELECT (SELECT COALESCE(MAX(id), 0) FROM cooper_tests)
+                           + row_number() OVER (ORDER BY _row),
+                       ? + member_id, test_date, diving_times, surface_times,
+                       pool_length_meters, notes
+                FROM cooper_tests_frame
+                """,
+                (member_base,),
+            )
+            conn.execute(
+                """
+                INSERT INTO indoor_trials (id, member_id, trial_date, location,
+                                           distance_meters, time_seconds,
+                                           pool_length_meters)
+                SELECT (SELECT COALESCE(MAX(id), 0) FROM indoor_trials)
+                           + row_number() OVER (ORDER BY _row),
+                       ? + member_id, trial_date, location, distance_meters,
+                       time_seconds, pool_length_meters
+                FROM indoor_trials_frame
+                """,
+                (member_base,),
+            )
+
+        clear_member_cache()
+        clear_stats_cache()
+        logger.info(
+            f"Bulk inserted {len(members)} members, {len(cooper_tests)} Cooper tests "
+            f"and {len(indoor_trials)} indoor trials"
+        )
+        return len(members), len(cooper_tests), len(indoor_trials)
+
+    except Exception as e:
+        logger.error(f"Failed to bulk insert generated data: {e}")
+        raise
+
+    finally:
+        for view in ("members_frame", "cooper_tests_frame", "indoor_trials_frame"):
+            conn.unregister(view)
+
+
 def get_performance_trends_cooper(
     member_id: int | None = None,
+    db: DatabaseConnection | None = None,
 ) -> list[PerformanceTrend]:
     """Get Cooper test performance trends for visualization."""
     try:
-        db = get_db_connection()
+        # Imported here so that loading the db package does not pull in NumPy
+        import numpy as np
+
+        db = db or get_db_connection()
 
+        # Sum each test's cycle times and count its cycles in SQL
+        query = """
+        SELECT m.id, m.name, m.surname,
+               ct.test_date,
+               COALESCE(
+                   list_sum(list_transform(ct.diving_times, lambda t: epoch(t))), 0
+               ) AS total_diving_seconds,
+               COALESCE(
+                   list_sum(list_transform(ct.surface_times, lambda t: epoch(t))), 0
+               ) AS total_surface_seconds,
+               LEAST(
+                   COALESCE(len(ct.diving_times), 0), COALESCE(len(ct.surface_times), 0)
+               ) AS total_cycles
+        FROM cooper_tests ct
+        JOIN members m ON ct.member_id = m.id
+        {where}
+        ORDER BY {order}
+        """
         if member_id:
-            query = """
-            SELECT m.name || ' ' || m.surname as member_name,
-                   ct.test_date, ct.diving_times, ct.surface_times
-            FROM cooper_tests ct
-            JOIN members m ON ct.member_id = m.id
-            WHERE ct.member_id = ?
-            ORDER BY ct.test_date
-            """
-            rows = db.fetch_all(query, (member_id,))
+            rows = db.fetch_all(
+                query.format(where="WHERE ct.member_id = ?", order="ct.test_date"),
+                (member_id,),
+            )
         else:
-            query = """
-            SELECT m.name || ' ' || m.surname as member_name,
-                   ct.test_date, ct.diving_times, ct.surface_times
-            FROM cooper_tests ct
-            JOIN members m ON ct.member_id = m.id
-            ORDER BY m.id, ct.test_date
-            """
-            rows = db.fetch_all(query)
+            rows = db.fetch_all(query.format(where="", order="m.id, ct.test_date"))
 
-        # Process data into performance trends
+        # Group the per-test metrics by member ID, building each name once.
+        # Rows arrive ordered by member, so the bucket is only looked up when
+        # the member changes.
         trends = {}
-
-        for row in rows:
-            member_name = row[0]
-            test_date = row[1]
-            diving_times = row[2] if row[2] else []
-            surface_times = row[3] if row[3] else []
-
-            if member_name not in trends:
-                trends[member_name] = {
-                    "dates": [],
-                    "diving_values": [],
-                    "surface_values": [],
-                    "cycles_values": [],
-                }
-
-            # Calculate metrics
-            total_diving_seconds = (
-                sum(
-                    t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1_000_000
-                    for t in diving_times
-                )
-                if diving_times
-                else 0
-            )
-
-            total_surface_seconds = (
-                sum(
-                    t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1_000_000
-                    for t in surface_times
-                )
-                if surface_times
-                else 0
-            )
-
-            total_cycles = min(len(diving_times), len(surface_times))
-
-            trends[member_name]["dates"].append(test_date)
-            trends[member_name]["diving_values"].append(total_diving_seconds)
-            trends[member_name]["surface_values"].append(total_surface_seconds)
-            trends[member_name]["cycles_values"].append(total_cycles)
+        last_mid = data = None
+
+        for mid, name, surname, test_date, diving, surface, cycles in rows:
+            if mid != last_mid:
+                data = trends.get(mid)
+                if data is None:
+                    data = trends[mid] = {
+                        "member_name": f"{name} {surname}",
+                        "dates": [],
+                        "diving_values": [],
+                        "surface_values": [],
+                        "cycles_values": [],
+                    }
+                last_mid = mid
+
+            data["dates"].append(test_date)
+            data["diving_values"].append(diving)
+            data["surface_values"].append(surface)
+            data["cycles_values"].append(cycles)
 
         # Convert to PerformanceTrend objects
         result = []
-        for member_name, data in trends.items():
+        for data in trends.values():
+            member_name = data["member_name"]
             result.extend(
                 [
                     PerformanceTrend(
                         member_name=member_name,
                         dates=data["dates"],
-                        values=data["diving_values"],
+                        values=np.asarray(data["diving_values"], dtype=float),
                         metric_type="diving_time",
                     ),
                     PerformanceTrend(
                         member_name=member_name,
                         dates=data["dates"],
-                        values=data["surface_values"],
+                        values=np.asarray(data["surface_values"], dtype=float),
                         metric_type="surface_time",
                     ),
                     PerformanceTrend(
                         member_name=member_name,
                         dates=data["dates"],
-                        values=data["cycles_values"],
+                        values=np.asarray(data["cycles_values"], dtype=float),
                         metric_type="cycles",
                     ),
                 ]
@@ -481,79 +681,82 @@ def get_performance_trends_cooper(
         logger.info(f"Generated {len(result)} Cooper test performance trends")
         return result
 
-    except Exception as e:
+    except duckdb.Error as e:
         logger.error(f"Failed to get Cooper test performance trends: {e}")
         return []
 
 
 def get_performance_trends_trials(
     member_id: int | None = None,
+    db: DatabaseConnection | None = None,
 ) -> list[PerformanceTrend]:
     """Get indoor trial performance trends for visualization."""
     try:
-        db = get_db_connection()
+        # Imported here so that loading the db package does not pull in NumPy
+        import numpy as np
 
+        db = db or get_db_connection()
+
+        # Compute distance and speed per trial in SQL
+        query = """
+        SELECT m.id, m.name, m.surname,
+               it.trial_date,
+               CAST(it.distance_meters AS DOUBLE) AS distance,
+               CASE WHEN it.time_seconds > 0
+                    THEN it.distance_meters / it.time_seconds
+                    ELSE 0.0
+               END AS speed_mps
+        FROM indoor_trials it
+        JOIN members m ON it.member_id = m.id
+        {where}
+        ORDER BY {order}
+        """
         if member_id:
-            query = """
-            SELECT m.name || ' ' || m.surname as member_name,
-                   it.trial_date, it.distance_meters, it.time_seconds
-            FROM indoor_trials it
-            JOIN members m ON it.member_id = m.id
-            WHERE it.member_id = ?
-            ORDER BY it.trial_date
-            """
-            rows = db.fetch_all(query, (member_id,))
+            rows = db.fetch_all(
+                query.format(where="WHERE it.member_id = ?", order="it.trial_date"),
+                (member_id,),
+            )
         else:
-            query = """
-            SELECT m.name || ' ' || m.surname as member_name,
-                   it.trial_date, it.distance_meters, it.time_seconds
-            FROM indoor_trials it
-            JOIN members m ON it.member_id = m.id
-            ORDER BY m.id, it.trial_date
-            """
-            rows = db.fetch_all(query)
+            rows = db.fetch_all(query.format(where="", order="m.id, it.trial_date"))
 
-        # Process data into performance trends
+        # Group the per-trial metrics by member ID, building each name once.
+        # Rows arrive ordered by member, so the bucket is only looked up when
+        # the member changes.
         trends = {}
-
-        for row in rows:
-            member_name = row[0]
-            trial_date = row[1]
-            distance_meters = row[2]
-            time_seconds = row[3]
-
-            if member_name not in trends:
-                trends[member_name] = {
-                    "dates": [],
-                    "distance_values": [],
-                    "speed_values": [],
-                }
-
-            trends[member_name]["dates"].append(trial_date)
-            trends[member_name]["distance_values"].append(float(distance_meters))
-
-            # Calculate speed if time is available
-            if time_seconds and time_seconds > 0:
-                speed_mps = distance_meters / time_seconds
-                trends[member_name]["speed_values"].append(speed_mps)
-            else:
-                trends[member_name]["speed_values"].append(0.0)
+        last_mid = data = None
+
+        for mid, name, surname, trial_date, distance, speed_mps in rows:
+            if mid != last_mid:
+                data = trends.get(mid)
+                if data is None:
+                    data = trends[mid] = {
+                        "member_name": f"{name} {surname}",
+                        "dates": [],
+                        "distance_values": [],
+                        "speed_values": [],
+                    }
+                last_mid = mid
+
+            data["dates"].append(trial_date)
+            data["distance_values"].append(distance)
+            data["speed_values"].append(speed_mps)
 
         # Convert to PerformanceTrend objects
         result = []
-        for member_name, data in trends.items():
+        for data in trends.values():
+            member_name = data["member_name"]
             result.extend(
                 [
                     PerformanceTrend(
                         member_name=member_name,
                         dates=data["dates"],
-                        values=data["distance_values"],
+                        values=np.asarray(data["distance_values"], dtype=float),
                         metric_type="distance",
                     ),
                     PerformanceTrend(
                         member_name=member_name,
                         dates=data["dates"],
-                        values=data["speed_values"],
+                        values=np.asarray(data["speed_values"], dtype=float),
                         metric_type="speed",
                     ),
                 ]
@@ -562,6 +765,6 @@ def get_performance_trends_trials(
         logger.info(f"Generated {len(result)} indoor trial performance trends")
         return result
 
-    except Exception as e:
+    except duckdb.Error as e:
         logger.error(f"Failed to get indoor trial performance trends: {e}")
         return []
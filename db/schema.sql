@@ -59,3 +59,9 @@ CREATE INDEX IF NOT EXISTS idx_members_name ON members(surname, name);
 CREATE INDEX IF NOT EXISTS idx_members_membership_date ON members(membership_start_date);
 CREATE INDEX IF NOT EXISTS idx_dashboard_users_username ON dashboard_users(username);
 CREATE INDEX IF NOT EXISTS idx_dashboard_users_active ON dashboard_users(is_active);
+
+-- Key/value metadata, e.g. the fingerprint of the last applied schema
+CREATE TABLE IF NOT EXISTS aqualog_meta (
+    key VARCHAR PRIMARY KEY,
+    value VARCHAR NOT NULL
+);
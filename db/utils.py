@@ -3,21 +3,133 @@ Database utility functions for Aqualog.
 Provides database management, validation, and maintenance operations.
 """
 
+import io
+import logging
+import os
+import shutil
+import sys
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+from .connection import DatabaseConnection, get_db_connection
+
+logger = logging.getLogger(__name__)
+
+# Buffer size for file copies where sendfile is unavailable
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Rows fetched per batch while exporting the schema
+SCHEMA_FETCH_SIZE = 1024
+
+# Seconds a get_detailed_stats result is reused before querying again
+DETAILED_STATS_TTL = 60.0
+
+# (timestamp, stats) per database path, see get_detailed_stats
+_detailed_stats_cache: dict[Path, tuple[float, dict[str, Any]]] = {}
+
+# Single-row aggregate behind get_detailed_stats; each base table is scanned
+# once by its own CTE
+_STATS_SQL = """
+WITH member_ages AS (
+    SELECT EXTRACT(YEAR FROM CURRENT_DATE) - EXTRACT(YEAR FROM date_of_birth) AS age
+    FROM members
+),
+member_stats AS (
+    SELECT
+        COUNT(*) AS total_members,
+        MIN(age) AS min_age,
+        MAX(age) AS max_age,
+        AVG(age) AS avg_age
+    FROM member_ages
+),
+cooper_stats AS (
+    SELECT
+        COUNT(*) AS total_cooper_tests,
+        COUNT(DISTINCT member_id) AS members_with_tests,
+        AVG(array_length(diving_times)) AS avg_cycles_per_test,
+        MIN(test_date) AS earliest_test,
+        MAX(test_date) AS latest_test
+    FROM cooper_tests
+),
+trial_stats AS (
+    SELECT
+        COUNT(*) AS total_indoor_trials,
+        COUNT(DISTINCT member_id) AS members_with_trials,
+        AVG(distance_meters) AS avg_distance,
+        MIN(distance_meters) AS min_distance,
+        MAX(distance_meters) AS max_distance,
+        COUNT(time_seconds) AS trials_with_time
+    FROM indoor_trials
+),
+cooper_counts AS (
+    SELECT member_id, COUNT(*) AS n FROM cooper_tests GROUP BY member_id
+),
+trial_counts AS (
+    SELECT member_id, COUNT(*) AS n FROM indoor_trials GROUP BY member_id
+),
+most_active AS (
+    SELECT m.name || ' ' || m.surname as member_name,
+           COALESCE(c.n, 0) + COALESCE(t.n, 0) as total_activities
+    FROM members m
+    LEFT JOIN cooper_counts c ON c.member_id = m.id
+    LEFT JOIN trial_counts t ON t.member_id = m.id
+    ORDER BY total_activities DESC, m.id
+    LIMIT 1
+)
+SELECT
+    total_members,
+    total_cooper_tests,
+    total_indoor_trials,
+    min_age,
+    max_age,
+    avg_age,
+    members_with_tests,
+    avg_cycles_per_test,
+    earliest_test,
+    latest_test,
+    members_with_trials,
+    avg_distance,
+    min_distance,
+    max_distance,
+    trials_with_time,
+    most_active.member_name AS most_active_member,
+    most_active.total_activities AS most_active_member_activities
+FROM member_stats
+CROSS JOIN cooper_stats
+CROSS JOIN trial_stats
+LEFT JOIN most_active ON true
+"""
 
-from loguru import logger
 
-from .connection import get_db_connection
+# Table counts, orphan checks and data-quality checks in a single row
+_VALIDATION_SQL = """
+SELECT
+    (SELECT COUNT(*) FROM members) AS members,
+    (SELECT COUNT(*) FROM cooper_tests) AS cooper_tests,
+    (SELECT COUNT(*) FROM indoor_trials) AS indoor_trials,
+    (SELECT COUNT(*) FROM cooper_tests ct
+     WHERE NOT EXISTS (SELECT 1 FROM members m WHERE m.id = ct.member_id)) AS orphaned_cooper,
+    (SELECT COUNT(*) FROM indoor_trials it
+     WHERE NOT EXISTS (SELECT 1 FROM members m WHERE m.id = it.member_id)) AS orphaned_trials,
+    (SELECT COUNT(*) FROM members
+     WHERE date_of_birth > CURRENT_DATE) AS future_births,
+    (SELECT COUNT(*) FROM members
+     WHERE membership_start_date < date_of_birth) AS invalid_membership,
+    (SELECT COUNT(*) FROM cooper_tests
+     WHERE array_length(diving_times) = 0
+        OR array_length(surface_times) = 0) AS empty_cooper_times,
+    (SELECT COUNT(*) FROM indoor_trials
+     WHERE distance_meters <= 0) AS zero_distance_trials
+"""
 
 
 def initialize_database(db_path: str = "data/aqualog.duckdb") -> bool:
     """Initialize database with schema and return success status."""
     try:
         # Create database connection (this will automatically initialize schema)
-        from .connection import DatabaseConnection
-
-        db = DatabaseConnection(db_path)
+        db = get_db_connection(db_path)
         db.connect()
 
         logger.info(f"Database initialized successfully at {db_path}")
@@ -33,12 +145,22 @@ def clear_all_data() -> bool:
     try:
         db = get_db_connection()
 
-        # Clear tables in correct order (respecting foreign key constraints)
-        tables = ["cooper_tests", "indoor_trials", "members"]
+        # Clear the referencing tables together; DuckDB checks foreign keys
+        # eagerly, so members can only be emptied once that has committed
+        with db.transaction() as cursor:
+            for table in ("cooper_tests", "indoor_trials"):
+                cursor.execute(f"TRUNCATE {table}")
+                logger.info(f"Cleared all data from {table} table")
+
+        db.execute_query("TRUNCATE members")
+        logger.info("Cleared all data from members table")
+
+        clear_stats_cache()
+
+        # Imported here: queries depends on this module
+        from .queries import clear_member_cache
 
-        for table in tables:
-            db.execute_query(f"DELETE FROM {table}")
-            logger.info(f"Cleared all data from {table} table")
+        clear_member_cache()
 
         logger.info("All database data cleared successfully")
         return True
@@ -48,10 +170,12 @@ def clear_all_data() -> bool:
         return False
 
 
-def validate_database_integrity() -> dict[str, Any]:
+def validate_database_integrity(
+    db: DatabaseConnection | None = None,
+) -> dict[str, Any]:
     """Validate database integrity and return validation results."""
     try:
-        db = get_db_connection()
+        db = db or get_db_connection()
         validation_results = {
             "valid": True,
             "errors": [],
@@ -60,91 +184,58 @@ def validate_database_integrity() -> dict[str, Any]:
             "foreign_key_violations": [],
         }
 
-        # Check table existence and get counts
-        tables = ["members", "cooper_tests", "indoor_trials"]
-
-        for table in tables:
-            try:
-                count_result = db.fetch_one(f"SELECT COUNT(*) FROM {table}")
-                validation_results["table_counts"][table] = (
-                    count_result[0] if count_result else 0
-                )
-            except Exception as e:
-                validation_results["errors"].append(
-                    f"Table {table} not accessible: {e}"
-                )
-                validation_results["valid"] = False
+        fk_violations = validation_results["foreign_key_violations"]
+        warnings = validation_results["warnings"]
+
+        counts = db.fetch_one(_VALIDATION_SQL)
+        (
+            members,
+            cooper_tests,
+            indoor_trials,
+            orphaned_cooper,
+            orphaned_trials,
+            future_births,
+            invalid_membership,
+            empty_cooper_times,
+            zero_distance_trials,
+        ) = counts
+
+        validation_results["table_counts"] = {
+            "members": members,
+            "cooper_tests": cooper_tests,
+            "indoor_trials": indoor_trials,
+        }
 
         # Check foreign key constraints
-        # Check cooper_tests references
-        orphaned_cooper = db.fetch_one("""
-            SELECT COUNT(*) FROM cooper_tests ct
-            LEFT JOIN members m ON ct.member_id = m.id
-            WHERE m.id IS NULL
-        """)
-
-        if orphaned_cooper and orphaned_cooper[0] > 0:
-            validation_results["foreign_key_violations"].append(
-                f"Found {orphaned_cooper[0]} Cooper tests with invalid member references"
+        if orphaned_cooper > 0:
+            fk_violations.append(
+                f"Found {orphaned_cooper} Cooper tests with invalid member references"
             )
             validation_results["valid"] = False
 
-        # Check indoor_trials references
-        orphaned_trials = db.fetch_one("""
-            SELECT COUNT(*) FROM indoor_trials it
-            LEFT JOIN members m ON it.member_id = m.id
-            WHERE m.id IS NULL
-        """)
-
-        if orphaned_trials and orphaned_trials[0] > 0:
-            validation_results["foreign_key_violations"].append(
-                f"Found {orphaned_trials[0]} indoor trials with invalid member references"
+        if orphaned_trials > 0:
+            fk_violations.append(
+                f"Found {orphaned_trials} indoor trials with invalid member references"
             )
             validation_results["valid"] = False
 
         # Check for data quality issues
-        # Members with future birth dates
-        future_births = db.fetch_one("""
-            SELECT COUNT(*) FROM members
-            WHERE date_of_birth > CURRENT_DATE
-        """)
-
-        if future_births and future_births[0] > 0:
-            validation_results["warnings"].append(
-                f"Found {future_births[0]} members with future birth dates"
-            )
-
-        # Members with membership dates before birth dates
-        invalid_membership = db.fetch_one("""
-            SELECT COUNT(*) FROM members
-            WHERE membership_start_date < date_of_birth
-        """)
+        if future_births > 0:
+            warnings.append(f"Found {future_births} members with future birth dates")
 
-        if invalid_membership and invalid_membership[0] > 0:
-            validation_results["warnings"].append(
-                f"Found {invalid_membership[0]} members with membership dates before birth dates"
+        if invalid_membership > 0:
+            warnings.append(
+                f"Found {invalid_membership} members with membership dates before birth dates"
             )
 
-        # Cooper tests with empty time arrays
-        empty_cooper_times = db.fetch_one("""
-            SELECT COUNT(*) FROM cooper_tests
-            WHERE array_length(diving_times) = 0 OR array_length(surface_times) = 0
-        """)
-
-        if empty_cooper_times and empty_cooper_times[0] > 0:
-            validation_results["warnings"].append(
-                f"Found {empty_cooper_times[0]} Cooper tests with empty time arrays"
+        if empty_cooper_times > 0:
+            warnings.append(
+                f"Found {empty_cooper_times} Cooper tests with empty time arrays"
             )
 
-        # Indoor trials with zero distance
-        zero_distance_trials = db.fetch_one("""
-            SELECT COUNT(*) FROM indoor_trials
-            WHERE distance_meters <= 0
-        """)
-
-        if zero_distance_trials and zero_distance_trials[0] > 0:
-            validation_results["warnings"].append(
-                f"Found {zero_distance_trials[0]} indoor trials with zero or negative distance"
+        if zero_distance_trials > 0:
+            warnings.append(
+                f"Found {zero_distance_trials} indoor trials with zero or negative distance"
             )
 
         logger.info(
@@ -163,50 +254,60 @@ def validate_database_integrity() -> dict[str, Any]:
         }
 
 
+def _write_schema(db: DatabaseConnection, sink: TextIO) -> None:
+    """Stream the table, view and index definitions into ``sink`` as they are fetched."""
+    # Get schema information for all tables, in creation order so that foreign
+    # keys resolve on replay
+    schema_query = """
+    SELECT sql FROM duckdb_tables()
+    WHERE database_name = current_database() AND NOT internal
+    ORDER BY table_oid
+    """
+
+    # Views come after the tables they select from
+    view_query = """
+    SELECT sql FROM duckdb_views()
+    WHERE database_name = current_database() AND NOT internal
+    ORDER BY view_name
+    """
+
+    # Get index information
+    index_query = """
+    SELECT sql FROM duckdb_indexes()
+    WHERE database_name = current_database() AND sql IS NOT NULL
+    ORDER BY index_name
+    """
+
+    sink.write("-- Aqualog Database Schema Export\n")
+    sink.write(f"-- Generated on: {datetime.now()}\n\n")
+
+    sink.write("-- Tables\n")
+    for rows in db.iter_chunks(schema_query, chunk_size=SCHEMA_FETCH_SIZE):
+        for (sql,) in rows:
+            if sql:
+                sink.write(f"{sql.rstrip(';')};\n\n")
+
+    sink.write("-- Views\n")
+    for rows in db.iter_chunks(view_query, chunk_size=SCHEMA_FETCH_SIZE):
+        for (sql,) in rows:
+            if sql:
+                sink.write(f"{sql.rstrip(';')};\n\n")
+
+    sink.write("-- Indexes\n\n")
+    for rows in db.iter_chunks(index_query, chunk_size=SCHEMA_FETCH_SIZE):
+        for (sql,) in rows:
+            if sql:
+                sink.write(f"{sql.rstrip(';')};\n\n")
+
+
 def export_database_schema(output_path: str | None = None) -> str:
     """Export database schema to SQL file and return the schema as string."""
     try:
         db = get_db_connection()
 
-        # Get schema information for all tables
-        schema_query = """
-        SELECT sql FROM sqlite_master
-        WHERE type='table' AND name NOT LIKE 'sqlite_%'
-        ORDER BY name
-        """
-
-        schema_rows = db.fetch_all(schema_query)
-
-        # Get index information
-        index_query = """
-        SELECT sql FROM sqlite_master
-        WHERE type='index' AND name NOT LIKE 'sqlite_%' AND sql IS NOT NULL
-        ORDER BY name
-        """
-
-        index_rows = db.fetch_all(index_query)
-
-        # Build schema string
-        schema_lines = [
-            "-- Aqualog Database Schema Export",
-            f"-- Generated on: {logger._core.now()}",
-            "",
-            "-- Tables",
-        ]
-
-        for row in schema_rows:
-            if row[0]:  # sql column
-                schema_lines.append(row[0] + ";")
-                schema_lines.append("")
-
-        schema_lines.extend(["-- Indexes", ""])
-
-        for row in index_rows:
-            if row[0]:  # sql column
-                schema_lines.append(row[0] + ";")
-                schema_lines.append("")
-
-        schema_content = "\n".join(schema_lines)
+        buffer = io.StringIO()
+        _write_schema(db, buffer)
+        schema_content = buffer.getvalue()
 
         # Write to file if path provided
         if output_path:
@@ -225,110 +326,90 @@ def export_database_schema(output_path: str | None = None) -> str:
         return ""
 
 
-def get_detailed_stats() -> dict[str, Any]:
-    """Get detailed database statistics for analysis."""
-    try:
-        db = get_db_connection()
+def clear_stats_cache() -> None:
+    """Drop memoized get_detailed_stats results; call after any write."""
+    _detailed_stats_cache.clear()
 
-        stats = {
-            "basic_stats": {},
-            "member_stats": {},
-            "cooper_test_stats": {},
-            "indoor_trial_stats": {},
-            "performance_summary": {},
-        }
-
-        # Basic statistics
-        from .queries import get_database_stats
 
-        basic_stats = get_database_stats()
-        stats["basic_stats"] = {
-            "total_members": basic_stats.total_members,
-            "total_cooper_tests": basic_stats.total_cooper_tests,
-            "total_indoor_trials": basic_stats.total_indoor_trials,
-            "database_size_mb": basic_stats.database_size_mb,
-        }
+def get_detailed_stats(db: DatabaseConnection | None = None) -> dict[str, Any]:
+    """Get detailed database statistics for analysis.
 
-        # Member statistics
-        member_age_stats = db.fetch_one("""
-            SELECT
-                MIN(EXTRACT(YEAR FROM CURRENT_DATE) - EXTRACT(YEAR FROM date_of_birth)) as min_age,
-                MAX(EXTRACT(YEAR FROM CURRENT_DATE) - EXTRACT(YEAR FROM date_of_birth)) as max_age,
-                AVG(EXTRACT(YEAR FROM CURRENT_DATE) - EXTRACT(YEAR FROM date_of_birth)) as avg_age
-            FROM members
-        """)
-
-        if member_age_stats:
-            stats["member_stats"] = {
-                "min_age": member_age_stats[0],
-                "max_age": member_age_stats[1],
-                "avg_age": round(member_age_stats[2], 1) if member_age_stats[2] else 0,
-            }
+    Results are memoized per database for ``DETAILED_STATS_TTL`` seconds and
+    shared between callers, so the returned dict must not be mutated.
+    """
+    try:
+        db = db or get_db_connection()
+
+        now = time.monotonic()
+        cached = _detailed_stats_cache.get(db.db_path)
+        if cached is not None and now - cached[0] < DETAILED_STATS_TTL:
+            return cached[1]
+
+        row = db.fetch_one(_STATS_SQL)
+
+        (
+            total_members,
+            total_cooper_tests,
+            total_indoor_trials,
+            min_age,
+            max_age,
+            avg_age,
+            members_with_tests,
+            avg_cycles_per_test,
+            earliest_test,
+            latest_test,
+            members_with_trials,
+            avg_distance,
+            min_distance,
+            max_distance,
+            trials_with_time,
+            most_active_member,
+            most_active_member_activities,
+        ) = row
 
-        # Cooper test statistics
-        cooper_stats = db.fetch_one("""
-            SELECT
-                COUNT(DISTINCT member_id) as members_with_tests,
-                AVG(array_length(diving_times)) as avg_cycles_per_test,
-                MIN(test_date) as earliest_test,
-                MAX(test_date) as latest_test
-            FROM cooper_tests
-        """)
-
-        if cooper_stats:
-            stats["cooper_test_stats"] = {
-                "members_with_tests": cooper_stats[0],
-                "avg_cycles_per_test": round(cooper_stats[1], 1)
-                if cooper_stats[1]
+        stats = {
+            "basic_stats": {
+                "total_members": total_members,
+                "total_cooper_tests": total_cooper_tests,
+                "total_indoor_trials": total_indoor_trials,
+                "database_size_mb": db.get_database_size(),
+            },
+            "member_stats": {
+                "min_age": min_age,
+                "max_age": max_age,
+                "avg_age": round(avg_age, 1) if avg_age else 0,
+            },
+            "cooper_test_stats": {
+                "members_with_tests": members_with_tests,
+                "avg_cycles_per_test": round(avg_cycles_per_test, 1)
+                if avg_cycles_per_test
                 else 0,
-                "earliest_test": cooper_stats[2],
-                "latest_test": cooper_stats[3],
-            }
-
-        # Indoor trial statistics
-        trial_stats = db.fetch_one("""
-            SELECT
-                COUNT(DISTINCT member_id) as members_with_trials,
-                AVG(distance_meters) as avg_distance,
-                MIN(distance_meters) as min_distance,
-                MAX(distance_meters) as max_distance,
-                COUNT(CASE WHEN time_seconds IS NOT NULL THEN 1 END) as trials_with_time
-            FROM indoor_trials
-        """)
-
-        if trial_stats:
-            stats["indoor_trial_stats"] = {
-                "members_with_trials": trial_stats[0],
-                "avg_distance": round(trial_stats[1], 1) if trial_stats[1] else 0,
-                "min_distance": trial_stats[2],
-                "max_distance": trial_stats[3],
-                "trials_with_time": trial_stats[4],
+                "earliest_test": earliest_test,
+                "latest_test": latest_test,
+            },
+            "indoor_trial_stats": {
+                "members_with_trials": members_with_trials,
+                "avg_distance": round(avg_distance, 1) if avg_distance else 0,
+                "min_distance": min_distance,
+                "max_distance": max_distance,
+                "trials_with_time": trials_with_time,
                 "time_tracking_percentage": round(
-                    (trial_stats[4] / basic_stats.total_indoor_trials * 100)
-                    if basic_stats.total_indoor_trials > 0
+                    (trials_with_time / total_indoor_trials * 100)
+                    if total_indoor_trials > 0
                     else 0,
                     1,
                 ),
-            }
+            },
+            "performance_summary": {},
+        }
 
-        # Performance summary
-        most_active_member = db.fetch_one("""
-            SELECT m.name || ' ' || m.surname as member_name,
-                   COUNT(ct.id) + COUNT(it.id) as total_activities
-            FROM members m
-            LEFT JOIN cooper_tests ct ON m.id = ct.member_id
-            LEFT JOIN indoor_trials it ON m.id = it.member_id
-            GROUP BY m.id, m.name, m.surname
-            ORDER BY total_activities DESC
-            LIMIT 1
-        """)
-
-        if most_active_member:
+        if most_active_member is not None:
             stats["performance_summary"] = {
-                "most_active_member": most_active_member[0],
-                "most_active_member_activities": most_active_member[1],
+                "most_active_member": most_active_member,
+                "most_active_member_activities": most_active_member_activities,
             }
 
+        _detailed_stats_cache[db.db_path] = (now, stats)
         logger.info("Generated detailed database statistics")
         return stats
 
@@ -337,20 +418,76 @@ def get_detailed_stats() -> dict[str, Any]:
         return {}
 
 
-def backup_database(backup_path: str) -> bool:
-    """Create a backup of the database file."""
+def _copy_file(source: Path, destination: Path) -> None:
+    """Copy a file in-kernel with sendfile, or through a large buffer elsewhere."""
+    with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+        if sys.platform.startswith("linux"):
+            size = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        else:
+            shutil.copyfileobj(fsrc, fdst, length=COPY_BUFFER_SIZE)
+
+
+def _copy_database(db: DatabaseConnection, destination: Path) -> None:
+    """Copy the database into a new file through DuckDB, from one snapshot."""
+    for path in (destination, Path(f"{destination}.wal")):
+        path.unlink(missing_ok=True)
+
+    quoted_path = str(destination).replace("'", "''")
+    source = db.fetch_one("SELECT current_database()")[0]
+    db.execute_query(f"ATTACH '{quoted_path}' AS aqualog_backup (READ_WRITE)")
+    try:
+        db.execute_query(f'COPY FROM DATABASE "{source}" TO aqualog_backup')
+    finally:
+        db.execute_query("DETACH aqualog_backup")
+
+
+def backup_database(backup_path: str, fmt: str | None = None) -> bool:
+    """Create a backup of the database.
+
+    ``fmt="duckdb"`` produces a copy of the database file. The file is copied
+    byte for byte after a CHECKPOINT only while this process holds the sole
+    write connection and no other thread has a cursor; otherwise the rows are
+    copied with ``COPY FROM DATABASE``, which is slower but reads one
+    consistent snapshot while other threads or processes keep writing.
+    ``fmt="parquet"`` treats the path as a directory and writes a ZSTD-compressed
+    Parquet export (one file per table plus ``schema.sql`` and ``load.sql``).
+    When ``fmt`` is omitted it is inferred from the path: ``.duckdb`` means a
+    file copy, anything else a Parquet export.
+    """
     try:
         db = get_db_connection()
-        source_path = Path(db.db_path)
         backup_file = Path(backup_path)
+        quoted_path = str(backup_file).replace("'", "''")
 
         # Ensure backup directory exists
         backup_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Copy database file
-        import shutil
-
-        shutil.copy2(source_path, backup_file)
+        if backup_file.resolve() == db.db_path.resolve():
+            raise ValueError(f"Backup path is the database itself: {backup_path}")
+
+        if fmt is None:
+            fmt = "duckdb" if backup_file.suffix == ".duckdb" else "parquet"
+
+        if fmt == "duckdb":
+            with db.exclusive_checkpoint() as exclusive:
+                if exclusive:
+                    _copy_file(db.db_path, backup_file)
+            if not exclusive:
+                _copy_database(db, backup_file)
+        elif fmt == "parquet":
+            # 122880 rows matches DuckDB's own row group size
+            db.execute_query(
+                f"EXPORT DATABASE '{quoted_path}' "
+                "(FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 122880)"
+            )
+        else:
+            raise ValueError(f"Unknown backup format: {fmt}")
 
         logger.info(f"Database backed up to {backup_path}")
         return True
@@ -361,18 +498,20 @@ def backup_database(backup_path: str) -> bool:
 
 
 def optimize_database() -> bool:
-    """Optimize database performance by running VACUUM and ANALYZE."""
+    """Optimize database performance."""
     try:
         db = get_db_connection()
 
-        # Run VACUUM to reclaim space and defragment
-        db.execute_query("VACUUM")
-        logger.info("Database VACUUM completed")
+        # Run CHECKPOINT to flush the WAL and rewrite blocks, reclaiming space
+        db.execute_query("CHECKPOINT")
+        logger.info("Database CHECKPOINT completed")
 
         # Run ANALYZE to update query planner statistics
         db.execute_query("ANALYZE")
         logger.info("Database ANALYZE completed")
 
+        clear_stats_cache()
+
         logger.info("Database optimization completed successfully")
         return True
 
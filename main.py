@@ -109,12 +109,12 @@ def main():
 
         # Enhanced user info with proper emoji and styling
         if user.is_admin:
-            st.markdown("### :material/crown: Administrator")
-            st.markdown(f"**{user.display_name}**")
+            st.markdown(
+                f"### :material/crown: Administrator\n\n**{user.display_name}**"
+            )
             st.caption("Full system access")
         else:
-            st.markdown("### :material/account_box: User")
-            st.markdown(f"**{user.display_name}**")
+            st.markdown(f"### :material/account_box: User\n\n**{user.display_name}**")
             st.caption("Read-only access")
 
         st.divider()
@@ -0,0 +1,59 @@
+"""
+CLI commands for Aqualog, one module per command.
+
+Each module exposes ``register(app)``; ``scripts/cli.py`` imports only the
+module for the command being invoked.
+"""
+
+import functools
+import logging
+from collections.abc import Callable
+
+import typer
+
+logger = logging.getLogger(__name__)
+
+# Command name -> module in this package that registers it
+COMMAND_MODULES: dict[str, str] = {
+    "init-db": "init_db",
+    "clear-data": "clear_data",
+    "validate": "validate",
+    "stats": "stats",
+    "export-schema": "export_schema",
+    "backup": "backup",
+    "optimize": "optimize",
+    "populate": "populate",
+    "generate-sample": "generate_sample",
+    "create-user": "users",
+    "list-users": "users",
+    "change-password": "users",
+    "change-role": "users",
+    "deactivate-user": "users",
+    "activate-user": "users",
+    "unlock-user": "users",
+    "delete-user": "users",
+}
+
+
+def handle_errors(action: str) -> Callable[[Callable], Callable]:
+    """Report unexpected errors from a command as ``❌ Error <action>: ...``.
+
+    Typer's own exits, aborts and parameter errors pass through untouched, so a
+    command can still ``raise typer.Exit(1)`` after printing its own message.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except (typer.Exit, typer.Abort, typer.BadParameter):
+                raise
+            except Exception as e:
+                logger.error(f"Error {action}: {e}")
+                typer.echo(f"❌ Error {action}: {e}")
+                raise typer.Exit(1) from e
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,63 @@
+"""
+`backup` command: create a backup of the database.
+"""
+
+import logging
+from enum import StrEnum
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+class BackupFormat(StrEnum):
+    """Backup layouts understood by ``backup_database``."""
+
+    duckdb = "duckdb"
+    parquet = "parquet"
+
+
+@handle_errors("creating backup")
+def backup(
+    output: str = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Backup path: a .duckdb file for a single-file copy, or a directory for a "
+        "Parquet export with schema.sql and load.sql "
+        "(default: backup_YYYYMMDD_HHMMSS, suffixed .duckdb for --format duckdb)",
+    ),
+    fmt: BackupFormat = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help="Backup format (default: inferred from --output, parquet otherwise)",
+    ),
+) -> None:
+    """Create a backup of the database."""
+    if output is None:
+        from datetime import datetime
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = f"backup_{timestamp}"
+        if fmt == BackupFormat.duckdb:
+            output += ".duckdb"
+
+    logger.info(f"Creating database backup: {output}")
+
+    from db import backup_database
+
+    success = backup_database(output, fmt)
+    if success:
+        typer.echo(f"✅ Database backed up successfully to {output}")
+        logger.info(f"Database backup completed: {output}")
+    else:
+        typer.echo("❌ Database backup failed")
+        raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Register the command on the CLI app."""
+    app.command()(backup)
@@ -0,0 +1,42 @@
+"""
+`clear-data` command: clear all data from the database.
+"""
+
+import logging
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+@handle_errors("clearing data")
+def clear_data(
+    confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
+) -> None:
+    """Clear all data from the database."""
+    if not confirm:
+        confirm = typer.confirm(
+            "Are you sure you want to clear all data? This cannot be undone."
+        )
+        if not confirm:
+            typer.echo("Operation cancelled.")
+            return
+
+    logger.info("Clearing all database data")
+
+    from db import clear_all_data
+
+    success = clear_all_data()
+    if success:
+        typer.echo("✅ All data cleared successfully")
+        logger.info("Database data cleared")
+    else:
+        typer.echo("❌ Failed to clear data")
+        raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Register the command on the CLI app."""
+    app.command()(clear_data)
@@ -0,0 +1,36 @@
+"""
+`export-schema` command: export database schema to SQL file.
+"""
+
+import logging
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+@handle_errors("exporting schema")
+def export_schema(
+    output: str = typer.Option(
+        "schema_export.sql", "--output", "-o", help="Output file path for schema export"
+    ),
+) -> None:
+    """Export database schema to SQL file."""
+    logger.info(f"Exporting database schema to {output}")
+
+    from db import export_database_schema
+
+    schema_content = export_database_schema(output)
+    if schema_content:
+        typer.echo(f"✅ Schema exported successfully to {output}")
+        logger.info(f"Schema export completed: {output}")
+    else:
+        typer.echo("❌ Schema export failed")
+        raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Register the command on the CLI app."""
+    app.command()(export_schema)
@@ -0,0 +1,120 @@
+"""
+`generate-sample` command: generate sample data files for testing (without database insertion).
+"""
+
+import logging
+from pathlib import Path
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+@handle_errors("generating sample data")
+def generate_sample(
+    output_dir: str = typer.Option(
+        "sample_data", "--output", "-o", help="Output directory for sample data files"
+    ),
+) -> None:
+    """Generate sample data files for testing (without database insertion)."""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    def write_json(path: Path, data: list[dict]) -> None:
+        """Serialize data as indented UTF-8 JSON, dates as ISO strings."""
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            import json
+
+            path.write_text(
+                json.dumps(
+                    data, indent=2, ensure_ascii=False, default=lambda o: o.isoformat()
+                ),
+                encoding="utf-8",
+            )
+
+    logger.info(f"Generating sample data files in {output_dir}")
+
+    try:
+        from data_generator import DataGenerator
+    except ImportError as e:
+        logger.error(f"Failed to import data generator: {e}")
+        typer.echo("❌ Error: Data generator not available")
+        raise typer.Exit(1) from e
+
+    # Create output directory
+    output_path = Path(output_dir)
+    output_path.mkdir(exist_ok=True)
+
+    generator = DataGenerator()
+
+    # Generate sample members
+    members_data = []
+    for i in range(10):
+        member_data = generator.generate_member()
+        members_data.append(
+            {
+                "id": i + 1,
+                "first_name": member_data[0],
+                "last_name": member_data[1],
+                "birth_date": member_data[2],
+                "email": member_data[3],
+                "membership_date": member_data[4],
+            }
+        )
+
+    # Save members data
+    write_json(output_path / "sample_members.json", members_data)
+
+    # Generate sample Cooper tests
+    cooper_tests = []
+    for i in range(5):
+        test_data = generator.generate_cooper_test(i + 1, "intermediate")
+        cooper_tests.append(
+            {
+                "member_id": test_data[0],
+                "test_date": test_data[1],
+                "diving_times": test_data[2],
+                "surface_times": test_data[3],
+                "pool_length_meters": test_data[4],
+                "notes": test_data[5],
+            }
+        )
+
+    # Save Cooper tests data
+    write_json(output_path / "sample_cooper_tests.json", cooper_tests)
+
+    # Generate sample indoor trials
+    indoor_trials = []
+    for i in range(8):
+        trial_data = generator.generate_indoor_trial(i + 1, "intermediate")
+        indoor_trials.append(
+            {
+                "member_id": trial_data[0],
+                "trial_date": trial_data[1],
+                "location": trial_data[2],
+                "distance_meters": trial_data[3],
+                "time_seconds": trial_data[4],
+                "pool_length_meters": trial_data[5],
+            }
+        )
+
+    # Save indoor trials data
+    write_json(output_path / "sample_indoor_trials.json", indoor_trials)
+
+    typer.echo(f"✅ Sample data files generated in {output_dir}/")
+    typer.echo("  • sample_members.json (10 members)")
+    typer.echo("  • sample_cooper_tests.json (5 tests)")
+    typer.echo("  • sample_indoor_trials.json (8 trials)")
+
+    logger.info(f"Sample data generation completed: {output_dir}")
+
+
+def register(app: typer.Typer) -> None:
+    """Register the command on the CLI app."""
+    app.command()(generate_sample)
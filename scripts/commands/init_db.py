@@ -0,0 +1,50 @@
+"""
+`init-db` command: initialize the Aqualog database with schema.
+"""
+
+import logging
+from pathlib import Path
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+@handle_errors("initializing database")
+def init_db(
+    db_path: str = typer.Option(
+        "data/aqualog.duckdb",
+        "--db-path",
+        "-d",
+        help="Path to the DuckDB database file",
+    ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Force initialization even if database exists"
+    ),
+) -> None:
+    """Initialize the Aqualog database with schema."""
+    logger.info(f"Initializing database at {db_path}")
+
+    db_file = Path(db_path)
+    if db_file.exists() and not force:
+        typer.echo(
+            f"Database already exists at {db_path}. Use --force to reinitialize."
+        )
+        raise typer.Exit(1)
+
+    from db import initialize_database
+
+    success = initialize_database(db_path)
+    if success:
+        typer.echo(f"✅ Database initialized successfully at {db_path}")
+        logger.info("Database initialization completed")
+    else:
+        typer.echo("❌ Database initialization failed")
+        raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Register the command on the CLI app."""
+    app.command()(init_db)
@@ -0,0 +1,32 @@
+"""
+`optimize` command: optimize database performance (CHECKPOINT and ANALYZE).
+"""
+
+import logging
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+@handle_errors("optimizing database")
+def optimize() -> None:
+    """Optimize database performance (CHECKPOINT and ANALYZE)."""
+    logger.info("Optimizing database performance")
+
+    from db import optimize_database
+
+    success = optimize_database()
+    if success:
+        typer.echo("✅ Database optimization completed successfully")
+        logger.info("Database optimization completed")
+    else:
+        typer.echo("❌ Database optimization failed")
+        raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Register the command on the CLI app."""
+    app.command()(optimize)
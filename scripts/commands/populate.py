@@ -0,0 +1,134 @@
+"""
+`populate` command: populate database with synthetic Italian freediving data.
+"""
+
+import logging
+import os
+import sys
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+@handle_errors("during data generation")
+def populate(
+    members: int = typer.Option(
+        50, "--members", "-m", help="Number of members to generate", min=1, max=1000
+    ),
+    min_tests: int = typer.Option(
+        1, "--min-tests", help="Minimum Cooper tests per member", min=0, max=20
+    ),
+    max_tests: int = typer.Option(
+        5, "--max-tests", help="Maximum Cooper tests per member", min=1, max=20
+    ),
+    min_trials: int = typer.Option(
+        2, "--min-trials", help="Minimum indoor trials per member", min=0, max=50
+    ),
+    max_trials: int = typer.Option(
+        8, "--max-trials", help="Maximum indoor trials per member", min=1, max=50
+    ),
+    clear_first: bool = typer.Option(
+        False, "--clear", "-c", help="Clear existing data before populating"
+    ),
+    workers: int = typer.Option(
+        os.cpu_count() or 1,
+        "--workers",
+        "-w",
+        help="Number of processes generating data",
+        min=1,
+    ),
+    seed: int = typer.Option(
+        None,
+        "--seed",
+        "-s",
+        help="Random seed for reproducible data (with the same --workers)",
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Show detailed progress information"
+    ),
+) -> None:
+    """Populate database with synthetic Italian freediving data."""
+
+    # Validate parameters
+    if min_tests > max_tests:
+        typer.echo("❌ Error: min-tests cannot be greater than max-tests")
+        raise typer.Exit(1)
+
+    if min_trials > max_trials:
+        typer.echo("❌ Error: min-trials cannot be greater than max-trials")
+        raise typer.Exit(1)
+
+    from db import clear_all_data, get_db_connection
+
+    logger.info(f"Starting data population: {members} members")
+
+    # Clear data if requested
+    if clear_first:
+        typer.echo("🗑️  Clearing existing data...")
+        if not clear_all_data():
+            typer.echo("❌ Failed to clear existing data")
+            raise typer.Exit(1)
+        typer.echo("✅ Existing data cleared")
+
+    # Import data generator
+    try:
+        from data_generator import DataGenerator
+    except ImportError as e:
+        logger.error(f"Failed to import data generator: {e}")
+        typer.echo("❌ Error: Data generator not available")
+        raise typer.Exit(1) from e
+
+    # Initialize generator
+    generator = DataGenerator(seed=seed)
+
+    # Show the generation plan on a terminal or when asked; scripts don't need it
+    if verbose or sys.stdout.isatty():
+        estimated_tests = members * ((min_tests + max_tests) // 2)
+        estimated_trials = members * ((min_trials + max_trials) // 2)
+        typer.echo(
+            "📊 Generation Plan:\n"
+            f"  Members: {members}\n"
+            f"  Cooper Tests: ~{estimated_tests} ({min_tests}-{max_tests} per member)\n"
+            f"  Indoor Trials: ~{estimated_trials} "
+            f"({min_trials}-{max_trials} per member)\n"
+        )
+
+    # Progress callback
+    def progress_callback(message: str):
+        if verbose:
+            typer.echo(f"  {message}")
+
+    try:
+        stats = generator.populate_database(
+            num_members=members,
+            tests_per_member=(min_tests, max_tests),
+            trials_per_member=(min_trials, max_trials),
+            progress_callback=progress_callback,
+            workers=workers,
+        )
+    finally:
+        # Close explicitly; DuckDB does not reliably checkpoint at interpreter exit
+        get_db_connection().close()
+
+    # Show results
+    typer.echo("✅ Data generation completed!")
+    typer.echo("📊 Results:")
+    typer.echo(f"  Members created: {stats['members_created']}")
+    typer.echo(f"  Cooper tests created: {stats['cooper_tests_created']}")
+    typer.echo(f"  Indoor trials created: {stats['indoor_trials_created']}")
+
+    if stats["errors"]:
+        typer.echo(f"\n⚠️  Errors encountered: {len(stats['errors'])}")
+        if verbose:
+            for error in stats["errors"]:
+                typer.echo(f"    • {error}")
+
+    logger.info(f"Data population completed successfully: {stats}")
+
+
+def register(app: typer.Typer) -> None:
+    """Register the command on the CLI app."""
+    app.command()(populate)
@@ -0,0 +1,109 @@
+"""
+`stats` command: show database statistics.
+"""
+
+import logging
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+@handle_errors("retrieving statistics")
+def stats(
+    detailed: bool = typer.Option(
+        False, "--detailed", "-d", help="Show detailed statistics"
+    ),
+) -> None:
+    """Show database statistics."""
+    logger.info("Retrieving database statistics")
+
+    from db import get_database_stats, get_db_connection, get_detailed_stats
+
+    # Statistics never write, so share the file with other readers
+    db = get_db_connection(read_only=True)
+
+    if detailed:
+        stats_data = get_detailed_stats(db)
+
+        # Collect the report and write it in one call
+        lines = ["📊 Detailed Database Statistics", "=" * 40]
+
+        # Basic stats
+        basic = stats_data.get("basic_stats", {})
+        lines.append("\n:material/bid_landscape: Basic Statistics:")
+        lines.append(f"  Members: {basic.get('total_members', 0)}")
+        lines.append(f"  Cooper Tests: {basic.get('total_cooper_tests', 0)}")
+        lines.append(f"  Indoor Trials: {basic.get('total_indoor_trials', 0)}")
+        lines.append(f"  Database Size: {basic.get('database_size_mb', 0):.2f} MB")
+
+        # Member stats
+        member_stats = stats_data.get("member_stats", {})
+        if member_stats:
+            lines.append("\n👥 Member Statistics:")
+            lines.append(
+                f"  Age Range: {member_stats.get('min_age', 0)} - {member_stats.get('max_age', 0)} years"
+            )
+            lines.append(f"  Average Age: {member_stats.get('avg_age', 0)} years")
+
+        # Cooper test stats
+        cooper_stats = stats_data.get("cooper_test_stats", {})
+        if cooper_stats:
+            lines.append("\n🏊 Cooper Test Statistics:")
+            lines.append(
+                f"  Members with Tests: {cooper_stats.get('members_with_tests', 0)}"
+            )
+            lines.append(
+                f"  Avg Cycles per Test: {cooper_stats.get('avg_cycles_per_test', 0)}"
+            )
+            if cooper_stats.get("earliest_test"):
+                lines.append(
+                    f"  Date Range: {cooper_stats.get('earliest_test')} to {cooper_stats.get('latest_test')}"
+                )
+
+        # Indoor trial stats
+        trial_stats = stats_data.get("indoor_trial_stats", {})
+        if trial_stats:
+            lines.append("\n🏊‍♂️ Indoor Trial Statistics:")
+            lines.append(
+                f"  Members with Trials: {trial_stats.get('members_with_trials', 0)}"
+            )
+            lines.append(
+                f"  Distance Range: {trial_stats.get('min_distance', 0)} - {trial_stats.get('max_distance', 0)} meters"
+            )
+            lines.append(
+                f"  Average Distance: {trial_stats.get('avg_distance', 0)} meters"
+            )
+            lines.append(
+                f"  Trials with Time Data: {trial_stats.get('time_tracking_percentage', 0)}%"
+            )
+
+        # Performance summary
+        performance = stats_data.get("performance_summary", {})
+        if performance:
+            lines.append("\n:material/trophy: Performance Summary:")
+            lines.append(
+                f"  Most Active Member: {performance.get('most_active_member', 'N/A')}"
+            )
+            lines.append(
+                f"  Total Activities: {performance.get('most_active_member_activities', 0)}"
+            )
+
+        typer.echo("\n".join(lines))
+
+    else:
+        # Simple stats
+        stats_data = get_database_stats(db)
+        typer.echo("📊 Database Statistics")
+        typer.echo("=" * 25)
+        typer.echo(f"Members: {stats_data.total_members}")
+        typer.echo(f"Cooper Tests: {stats_data.total_cooper_tests}")
+        typer.echo(f"Indoor Trials: {stats_data.total_indoor_trials}")
+        typer.echo(f"Database Size: {stats_data.database_size_mb:.2f} MB")
+
+
+def register(app: typer.Typer) -> None:
+    """Register the command on the CLI app."""
+    app.command()(stats)
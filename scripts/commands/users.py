@@ -0,0 +1,255 @@
+"""
+Dashboard user management commands.
+"""
+
+import logging
+from enum import StrEnum
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+class Role(StrEnum):
+    """Dashboard user roles; Typer rejects anything else while parsing."""
+
+    admin = "admin"
+    user = "user"
+
+
+# DatabaseAuthManager method -> (verb, past tense, gerund) used in messages
+_USER_OPS: dict[str, tuple[str, str, str]] = {
+    "deactivate_user": ("deactivate", "deactivated", "deactivating"),
+    "activate_user": ("activate", "activated", "activating"),
+    "unlock_user": ("unlock", "unlocked", "unlocking"),
+    "delete_user": ("delete", "deleted", "deleting"),
+}
+
+
+@handle_errors("creating user")
+def create_user(
+    username: str = typer.Option(
+        ..., "--username", "-u", help="Username for the new user"
+    ),
+    password: str = typer.Option(
+        ..., "--password", "-p", help="Password for the new user"
+    ),
+    role: Role = typer.Option(Role.user, "--role", "-r", help="User role"),
+    full_name: str = typer.Option(None, "--name", "-n", help="Full name of the user"),
+    email: str = typer.Option(None, "--email", "-e", help="Email address of the user"),
+) -> None:
+    """Create a new dashboard user."""
+    logger.info(f"Creating user: {username} (role: {role})")
+
+    from app.auth.db_auth import get_db_auth_manager
+
+    db_auth = get_db_auth_manager()
+
+    # Check if user already exists
+    existing_user = db_auth.get_user_by_username(username)
+    if existing_user:
+        typer.echo(f"❌ Error: User '{username}' already exists")
+        raise typer.Exit(1)
+
+    # Create user
+    user_id = db_auth.create_user(
+        username=username,
+        password=password,
+        role=role,
+        full_name=full_name,
+        email=email,
+    )
+
+    typer.echo(f"✅ User '{username}' created successfully (ID: {user_id})")
+    typer.echo(f"   Role: {role}")
+    if full_name:
+        typer.echo(f"   Name: {full_name}")
+    if email:
+        typer.echo(f"   Email: {email}")
+
+    logger.info(f"User creation completed: {username}")
+
+
+@handle_errors("listing users")
+def list_users() -> None:
+    """List all dashboard users."""
+    logger.info("Listing all users")
+
+    from app.auth.db_auth import get_db_auth_manager
+
+    db_auth = get_db_auth_manager()
+    users = db_auth.get_all_users()
+
+    if not users:
+        typer.echo("No users found.")
+        return
+
+    typer.echo("👥 Dashboard Users")
+    typer.echo("=" * 50)
+
+    for user in users:
+        status = "🟢 Active" if user.is_active else "🔴 Inactive"
+        locked = " 🔒 Locked" if user.is_locked else ""
+        role_icon = "👑" if user.is_admin else "👤"
+
+        typer.echo(f"{role_icon} {user.username} ({user.role}) - {status}{locked}")
+        if user.full_name:
+            typer.echo(f"   Name: {user.full_name}")
+        if user.email:
+            typer.echo(f"   Email: {user.email}")
+        if user.last_login:
+            typer.echo(f"   Last Login: {user.last_login}")
+        typer.echo(f"   Created: {user.created_at}")
+        typer.echo()
+
+    logger.info(f"Listed {len(users)} users")
+
+
+@handle_errors("changing password")
+def change_password(
+    username: str = typer.Option(
+        ..., "--username", "-u", help="Username to change password for"
+    ),
+    new_password: str = typer.Option(..., "--password", "-p", help="New password"),
+) -> None:
+    """Change user password."""
+    logger.info(f"Changing password for user: {username}")
+
+    from app.auth.db_auth import get_db_auth_manager
+
+    db_auth = get_db_auth_manager()
+
+    # Check if user exists
+    user = db_auth.get_user_by_username(username)
+    if not user:
+        typer.echo(f"❌ Error: User '{username}' not found")
+        raise typer.Exit(1)
+
+    # Change password
+    success = db_auth.change_password(username, new_password)
+
+    if success:
+        typer.echo(f"✅ Password changed successfully for user '{username}'")
+        logger.info(f"Password changed for user: {username}")
+    else:
+        typer.echo(f"❌ Failed to change password for user '{username}'")
+        raise typer.Exit(1)
+
+
+@handle_errors("changing role")
+def change_role(
+    username: str = typer.Option(
+        ..., "--username", "-u", help="Username to change role for"
+    ),
+    role: Role = typer.Option(..., "--role", "-r", help="New role"),
+) -> None:
+    """Change user role."""
+    logger.info(f"Changing role for user: {username} to {role}")
+
+    from app.auth.db_auth import get_db_auth_manager
+
+    db_auth = get_db_auth_manager()
+
+    # Check if user exists
+    user = db_auth.get_user_by_username(username)
+    if not user:
+        typer.echo(f"❌ Error: User '{username}' not found")
+        raise typer.Exit(1)
+
+    # Change role
+    success = db_auth.update_user_role(username, role)
+
+    if success:
+        typer.echo(f"✅ Role changed successfully for user '{username}' to '{role}'")
+        logger.info(f"Role changed for user: {username} to {role}")
+    else:
+        typer.echo(f"❌ Failed to change role for user '{username}'")
+        raise typer.Exit(1)
+
+
+def _apply_user_op(username: str, op: str) -> None:
+    """Run a ``DatabaseAuthManager`` account operation on an existing user."""
+    verb, past, gerund = _USER_OPS[op]
+    logger.info(f"{gerund.capitalize()} user: {username}")
+
+    from app.auth.db_auth import get_db_auth_manager
+
+    db_auth = get_db_auth_manager()
+
+    # Check if user exists
+    user = db_auth.get_user_by_username(username)
+    if not user:
+        typer.echo(f"❌ Error: User '{username}' not found")
+        raise typer.Exit(1)
+
+    success = getattr(db_auth, op)(username)
+
+    if success:
+        typer.echo(f"✅ User '{username}' {past} successfully")
+        logger.info(f"User {past}: {username}")
+    else:
+        typer.echo(f"❌ Failed to {verb} user '{username}'")
+        raise typer.Exit(1)
+
+
+@handle_errors("deactivating user")
+def deactivate_user(
+    username: str = typer.Option(
+        ..., "--username", "-u", help="Username to deactivate"
+    ),
+) -> None:
+    """Deactivate user account."""
+    _apply_user_op(username, "deactivate_user")
+
+
+@handle_errors("activating user")
+def activate_user(
+    username: str = typer.Option(..., "--username", "-u", help="Username to activate"),
+) -> None:
+    """Activate user account."""
+    _apply_user_op(username, "activate_user")
+
+
+@handle_errors("unlocking user")
+def unlock_user(
+    username: str = typer.Option(..., "--username", "-u", help="Username to unlock"),
+) -> None:
+    """Unlock user account."""
+    _apply_user_op(username, "unlock_user")
+
+
+@handle_errors("deleting user")
+def delete_user(
+    username: str = typer.Option(..., "--username", "-u", help="Username to delete"),
+    confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
+) -> None:
+    """Delete user account permanently."""
+
+    # Prevent deleting the default admin
+    if username == "admin":
+        typer.echo("❌ Error: Cannot delete the default admin user")
+        raise typer.Exit(1)
+
+    if not confirm:
+        confirm = typer.confirm(
+            f"Are you sure you want to delete user '{username}'? This cannot be undone."
+        )
+        if not confirm:
+            typer.echo("Operation cancelled.")
+            return
+
+    _apply_user_op(username, "delete_user")
+
+
+def register(app: typer.Typer) -> None:
+    """Register the commands on the CLI app."""
+    app.command()(create_user)
+    app.command()(list_users)
+    app.command()(change_password)
+    app.command()(change_role)
+    app.command()(deactivate_user)
+    app.command()(activate_user)
+    app.command()(unlock_user)
+    app.command()(delete_user)
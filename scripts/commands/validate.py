@@ -0,0 +1,58 @@
+"""
+`validate` command: validate database integrity and data quality.
+"""
+
+import logging
+
+import typer
+
+from scripts.commands import handle_errors
+
+logger = logging.getLogger(__name__)
+
+
+@handle_errors("during validation")
+def validate(
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Show detailed validation results"
+    ),
+) -> None:
+    """Validate database integrity and data quality."""
+    logger.info("Starting database validation")
+
+    from db import get_db_connection, validate_database_integrity
+
+    results = validate_database_integrity(get_db_connection(read_only=True))
+
+    # Collect the report and write it in one call
+    if results["valid"]:
+        lines = ["✅ Database validation passed"]
+    else:
+        lines = ["❌ Database validation failed"]
+
+    if verbose or not results["valid"]:
+        # Show table counts
+        lines.append("\n📊 Table Counts:")
+        lines.extend(
+            f"  {table}: {count}" for table, count in results["table_counts"].items()
+        )
+
+        # Show errors, warnings and foreign key violations
+        for heading, key in (
+            ("\n❌ Errors:", "errors"),
+            ("\n⚠️  Warnings:", "warnings"),
+            ("\n🔗 Foreign Key Violations:", "foreign_key_violations"),
+        ):
+            if results[key]:
+                lines.append(heading)
+                lines.extend(f"  • {item}" for item in results[key])
+
+    typer.echo("\n".join(lines))
+
+    if not results["valid"]:
+        raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Register the command on the CLI app."""
+    app.command()(validate)
@@ -7,8 +7,12 @@ from faker import Faker
 from faker.providers import BaseProvider
 from typing import List, Tuple, Optional
 from datetime import date, time, datetime, timedelta
+import itertools
 import random
-from loguru import logger
+import logging
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
 
 import sys
 from pathlib import Path
@@ -16,14 +20,69 @@ from pathlib import Path
 # Add parent directory to path for db imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from db import insert_member, insert_cooper_test, insert_indoor_trial
+from db import bulk_insert_frames, get_db_connection
+
+logger = logging.getLogger(__name__)
+
+# Members are at least 18 years old when they join
+ADULT_AGE = timedelta(days=18 * 365)
+
+# Cooper test is exactly 12 minutes (720 seconds)
+COOPER_TEST_DURATION = 720
+
+# Shortest possible cycle is 10s diving + 15s surface, so no test has more cycles
+MAX_COOPER_CYCLES = COOPER_TEST_DURATION // 25
+
+# Skill level -> inclusive (diving, surface) base ranges in seconds per cycle
+COOPER_CYCLE_RANGES = {
+    "beginner": ((12, 25), (25, 35)),
+    "intermediate": ((15, 30), (20, 35)),
+    "advanced": ((18, 35), (18, 30)),  # shorter recovery
+}
+
+# Coach notes occasionally attached to a Cooper test
+COOPER_TEST_NOTES = (
+    "Buona performance generale",
+    "Miglioramento rispetto al test precedente",
+    "Difficoltà negli ultimi cicli",
+    "Ottima tecnica di respirazione",
+    "Da lavorare sulla fase di recupero",
+    "Performance stabile durante tutto il test",
+    "Leggera stanchezza iniziale",
+)
+
+# Per-skill (2, 1) arrays of range starts and widths, rows being diving and surface
+_CYCLE_LOWS = {
+    skill: np.array([[diving[0]], [surface[0]]])
+    for skill, (diving, surface) in COOPER_CYCLE_RANGES.items()
+}
+_CYCLE_SPANS = {
+    skill: np.array([[diving[1] - diving[0] + 1], [surface[1] - surface[0] + 1]])
+    for skill, (diving, surface) in COOPER_CYCLE_RANGES.items()
+}
+
+# Diving times get 3% shorter and surface times 2% longer with every cycle,
+# never dropping below 10s diving and 15s surface
+_CYCLE_FATIGUE = np.stack(
+    [
+        1 - np.arange(MAX_COOPER_CYCLES) * 0.03,
+        1 + np.arange(MAX_COOPER_CYCLES) * 0.02,
+    ]
+)
+_CYCLE_FLOORS = np.array([[10], [15]])
+
+# time(0, s // 60, s % 60) for every second in an hour, shared instead of rebuilt
+_TIME_BY_SECONDS = tuple(time(0, s // 60, s % 60) for s in range(3600))
+
+# Uniform draws generated per refill of DataGenerator's random buffer
+RANDOM_BUFFER_SIZE = 1 << 16
 
 
 class FreedivingProvider(BaseProvider):
     """Custom Faker provider for freediving-specific data."""
 
     # Italian freediving locations
-    italian_pools = [
+    italian_pools = (
         "Piscina Comunale di Milano",
         "Centro Nuoto Torino",
         "Piscina Olimpica Roma",
@@ -36,10 +95,10 @@ class FreedivingProvider(BaseProvider):
         "Piscina Comunale Bari",
         "Centro Sportivo Catania",
         "Piscina Olimpica Verona",
-    ]
+    )
 
     # Common Italian email domains
-    italian_email_domains = [
+    italian_email_domains = (
         "gmail.com",
         "libero.it",
         "virgilio.it",
@@ -48,74 +107,79 @@ class FreedivingProvider(BaseProvider):
         "hotmail.it",
         "yahoo.it",
         "tiscali.it",
-    ]
+    )
 
     def italian_pool_location(self) -> str:
         """Generate an Italian pool location."""
-        return self.random_element(self.italian_pools)
+        return self.generator.random.choice(self.italian_pools)
 
     def italian_email(self, first_name: str, last_name: str) -> str:
         """Generate an Italian email address."""
-        domain = self.random_element(self.italian_email_domains)
-
-        # Various email formats
-        formats = [
-            f"{first_name.lower()}.{last_name.lower()}@{domain}",
-            f"{first_name.lower()}{last_name.lower()}@{domain}",
-            f"{first_name[0].lower()}.{last_name.lower()}@{domain}",
-            f"{first_name.lower()}{random.randint(1, 99)}@{domain}",
-            f"{last_name.lower()}.{first_name.lower()}@{domain}",
-        ]
+        domain = self.generator.random.choice(self.italian_email_domains)
+        first, last = first_name.lower(), last_name.lower()
+
+        # Pick one of the email formats, then build only that one
+        fmt = self.generator.random.randrange(5)
+        if fmt == 0:
+            local = f"{first}.{last}"
+        elif fmt == 1:
+            local = f"{first}{last}"
+        elif fmt == 2:
+            local = f"{first[0]}.{last}"
+        elif fmt == 3:
+            local = f"{first}{self.generator.random.randint(1, 99)}"
+        else:
+            local = f"{last}.{first}"
 
-        return self.random_element(formats)
+        return f"{local}@{domain}"
 
     def diving_time(self, min_seconds: int = 10, max_seconds: int = 40) -> time:
         """Generate a realistic diving time for Cooper tests."""
-        seconds = random.randint(min_seconds, max_seconds)
-        return time(0, seconds // 60, seconds % 60)
+        seconds = self.generator.random.randint(min_seconds, max_seconds)
+        return _TIME_BY_SECONDS[seconds]
 
     def surface_time(self, min_seconds: int = 15, max_seconds: int = 40) -> time:
         """Generate a realistic surface recovery time for Cooper tests."""
-        seconds = random.randint(min_seconds, max_seconds)
-        return time(0, seconds // 60, seconds % 60)
+        seconds = self.generator.random.randint(min_seconds, max_seconds)
+        return _TIME_BY_SECONDS[seconds]
 
     def cooper_test_cycles(self, min_cycles: int = 12, max_cycles: int = 36) -> int:
         """Generate number of cycles for a Cooper test."""
-        return random.randint(min_cycles, max_cycles)
+        return self.generator.random.randint(min_cycles, max_cycles)
 
     def pool_length(self) -> int:
         """Generate a realistic pool length."""
         # Use 25m pools exclusively (keep 50m as possibility but weight heavily toward 25m)
-        return random.choices([25, 50], weights=[100, 0])[0]
+        return self.generator.random.choices([25, 50], weights=[100, 0])[0]
 
     def freediving_distance(self, skill_level: str = "intermediate") -> int:
         """Generate realistic freediving distance based on skill level."""
         if skill_level == "beginner":
             # Normal athletes: 50-75m (75% of cohort)
-            return random.randint(50, 75)
+            return self.generator.random.randint(50, 75)
         elif skill_level == "intermediate":
             # Good athletes: 75-125m (23% of cohort)
-            return random.randint(75, 125)
+            return self.generator.random.randint(75, 125)
         elif skill_level == "advanced":
             # Elite athletes: 125m+ (2% of cohort)
-            return random.randint(125, 150)
+            return self.generator.random.randint(125, 150)
         else:
-            return random.randint(50, 85)
+            return self.generator.random.randint(50, 85)
 
     def freediving_time(self, distance: int, pool_length: int) -> Optional[int]:
         """Generate realistic time for a given distance (sometimes None)."""
         # 30% chance of no time recorded
-        if random.random() < 0.3:
+        if self.generator.random.random() < 0.3:
             return None
 
         # Calculate approximate time based on distance
         # Average speed around 1 m/s for freediving (0.9-1.1 m/s)
-        speed = random.uniform(0.9, 1.1)
+        speed = self.generator.random.uniform(0.9, 1.1)
         base_time = distance / speed
 
         # Add some variation and rest time between laps
         laps = distance / pool_length
-        rest_time = laps * random.uniform(2, 8)  # 2-8 seconds rest per lap
+        rest_time = laps * self.generator.random.uniform(2, 8)  # 2-8s per lap
 
         total_time = int(base_time + rest_time)
         return total_time
@@ -124,9 +188,17 @@ class FreedivingProvider(BaseProvider):
 class DataGenerator:
     """Main data generator class for Aqualog synthetic data."""
 
-    def __init__(self, locale: str = "it_IT"):
-        """Initialize the data generator with Italian locale."""
+    def __init__(self, locale: str = "it_IT", seed: Optional[int] = None):
+        """Initialize the data generator with Italian locale, optionally seeded."""
+        self.locale = locale
+
+        # Private random sources; Faker and FreedivingProvider draw from self.random
+        self.random = random.Random()
+        self.rng = np.random.default_rng()
+        self._random_buffer = np.empty(0)
+        self._random_pos = 0
         self.fake = Faker(locale)
+        self.fake.random = self.random
         self.fake.add_provider(FreedivingProvider)
 
         # Skill level distribution (realistic for a freediving society)
@@ -136,9 +208,34 @@ class DataGenerator:
             0.23,
             0.02,
         ]  # 75% normal (50-75m), 23% good (75-125m), 2% elite (125m+)
+        self._skill_cum_weights = list(itertools.accumulate(self.skill_weights))
+
+        # Date windows are fixed for the lifetime of a generation run
+        self.today = date.today()
+        self.two_years_ago = self.today - timedelta(days=730)
+        self.five_years_ago = self.today - timedelta(days=5 * 365)
+
+        if seed is not None:
+            self.seed(seed)
 
         logger.info(f"DataGenerator initialized with locale: {locale}")
 
+    def seed(self, seed: int) -> None:
+        """Seed every random source of this generator, Faker's included."""
+        self.random.seed(seed)
+        self.rng = np.random.default_rng(seed)
+        self._random_buffer = np.empty(0)
+        self._random_pos = 0
+
+    def _uniforms(self, n: int) -> np.ndarray:
+        """Return ``n`` uniform draws in [0, 1), refilling the buffer in bulk."""
+        if self._random_pos + n > len(self._random_buffer):
+            self._random_buffer = self.rng.random(max(n, RANDOM_BUFFER_SIZE))
+            self._random_pos = 0
+        start = self._random_pos
+        self._random_pos += n
+        return self._random_buffer[start : start + n]
+
     def generate_member(self) -> Tuple[str, str, date, str, date]:
         """Generate a single member's data."""
         # Generate basic info
@@ -153,10 +250,10 @@ class DataGenerator:
 
         # Membership start date: within last 5 years, after birth date
         min_membership_date = max(
-            birth_date + timedelta(days=18 * 365),  # At least 18 years old
-            date.today() - timedelta(days=5 * 365),  # Within last 5 years
+            birth_date + ADULT_AGE,  # At least 18 years old
+            self.five_years_ago,  # Within last 5 years
         )
-        max_membership_date = date.today()
+        max_membership_date = self.today
 
         membership_date = self.fake.date_between(
             start_date=min_membership_date, end_date=max_membership_date
@@ -171,72 +268,38 @@ class DataGenerator:
         if test_date is None:
             # Random test date within last 2 years
             test_date = self.fake.date_between(
-                start_date=date.today() - timedelta(days=730), end_date=date.today()
+                start_date=self.two_years_ago, end_date=self.today
             )
 
-        # Cooper test is exactly 12 minutes (720 seconds)
-        # Generate cycles until we reach or exceed 720 seconds, then cut off
-        COOPER_TEST_DURATION = 720  # 12 minutes in seconds
-
-        diving_times = []
-        surface_times = []
-        total_time = 0
-        cycle_count = 0
-
-        # Generate cycles until we exceed 12 minutes
-        while total_time < COOPER_TEST_DURATION:
-            # Diving times get shorter as fatigue sets in
-            fatigue_factor = 1 - (cycle_count * 0.03)  # 3% reduction per cycle
-
-            if member_skill == "beginner":
-                base_diving = random.randint(12, 25)  # 12-25 seconds for beginners
-                base_surface = random.randint(25, 35)  # 25-35 seconds surface time
-            elif member_skill == "intermediate":
-                base_diving = random.randint(15, 30)  # 15-30 seconds for intermediate
-                base_surface = random.randint(20, 35)  # 20-35 seconds surface time
-            else:  # advanced
-                base_diving = random.randint(18, 35)  # 18-35 seconds for advanced
-                base_surface = random.randint(
-                    18, 30
-                )  # 18-30 seconds surface time (shorter recovery)
-
-            # Apply fatigue
-            diving_seconds = max(
-                10, int(base_diving * fatigue_factor)
-            )  # Minimum 10 seconds
-            surface_seconds = max(
-                15, int(base_surface * (1 + (cycle_count * 0.02)))
-            )  # Slight increase in surface time with fatigue
-
-            # Check if this complete cycle would fit within 12 minutes
-            cycle_time = diving_seconds + surface_seconds
-            if total_time + cycle_time <= COOPER_TEST_DURATION:
-                # Complete cycle fits, add it
-                diving_times.append(time(0, diving_seconds // 60, diving_seconds % 60))
-                surface_times.append(
-                    time(0, surface_seconds // 60, surface_seconds % 60)
-                )
-                total_time += cycle_time
-                cycle_count += 1
-            else:
-                # This cycle would exceed 12 minutes, stop here
-                break
+        # Base times for every possible cycle in one vectorized step, then fatigue
+        if member_skill not in COOPER_CYCLE_RANGES:
+            member_skill = "advanced"
+        # The extra draw after the cycle draws decides the notes below
+        draws = self._uniforms(2 * MAX_COOPER_CYCLES + 1)
+        uniforms = draws[:-1].reshape(2, MAX_COOPER_CYCLES)
+        note_draw = float(draws[-1])
+        base = _CYCLE_LOWS[member_skill] + (
+            uniforms * _CYCLE_SPANS[member_skill]
+        ).astype(int)
+        cycles = np.maximum(_CYCLE_FLOORS, (base * _CYCLE_FATIGUE).astype(int))
+
+        # Keep the complete cycles that fit within 12 minutes
+        num_cycles = int(
+            np.searchsorted(
+                cycles.sum(axis=0).cumsum(), COOPER_TEST_DURATION, side="right"
+            )
+        )
+        diving, surface = cycles[:, :num_cycles].tolist()
+        diving_times = [_TIME_BY_SECONDS[seconds] for seconds in diving]
+        surface_times = [_TIME_BY_SECONDS[seconds] for seconds in surface]
 
         pool_length = self.fake.pool_length()
 
         # Generate notes (sometimes)
         notes = None
-        if random.random() < 0.3:  # 30% chance of notes
-            note_options = [
-                "Buona performance generale",
-                "Miglioramento rispetto al test precedente",
-                "Difficoltà negli ultimi cicli",
-                "Ottima tecnica di respirazione",
-                "Da lavorare sulla fase di recupero",
-                "Performance stabile durante tutto il test",
-                "Leggera stanchezza iniziale",
-            ]
-            notes = random.choice(note_options)
+        if note_draw < 0.3:  # 30% chance of notes
+            # Below 0.3 the draw is still uniform, so rescale it to pick the note
+            notes = COOPER_TEST_NOTES[int(note_draw / 0.3 * len(COOPER_TEST_NOTES))]
 
         return member_id, test_date, diving_times, surface_times, pool_length, notes
 
@@ -247,7 +310,7 @@ class DataGenerator:
         if trial_date is None:
             # Random trial date within last 2 years
             trial_date = self.fake.date_between(
-                start_date=date.today() - timedelta(days=730), end_date=date.today()
+                start_date=self.two_years_ago, end_date=self.today
             )
 
         location = self.fake.italian_pool_location()
@@ -257,101 +320,240 @@ class DataGenerator:
 
         return member_id, trial_date, location, distance, time_seconds, pool_length
 
+    def _generate_records(
+        self,
+        first_id: int,
+        count: int,
+        tests_per_member: Tuple[int, int],
+        trials_per_member: Tuple[int, int],
+        report: Optional[callable] = None,
+    ) -> Tuple[list, list, list]:
+        """
+        Generate member, Cooper test and indoor trial rows for ``count`` members.
+
+        ``report``, if given, is called once per member with the number of rows
+        generated for it.
+        """
+        members, cooper_tests, indoor_trials = [], [], []
+
+        skill_levels = self.random.choices(
+            self.skill_levels, cum_weights=self._skill_cum_weights, k=count
+        )
+
+        for member_id, skill_level in zip(
+            range(first_id, first_id + count), skill_levels, strict=True
+        ):
+            members.append((member_id, *self.generate_member()))
+
+            num_tests = self.random.randint(*tests_per_member)
+            for _ in range(num_tests):
+                cooper_tests.append(self.generate_cooper_test(member_id, skill_level))
+
+            num_trials = self.random.randint(*trials_per_member)
+            for _ in range(num_trials):
+                indoor_trials.append(self.generate_indoor_trial(member_id, skill_level))
+
+            if report:
+                report(1 + num_tests + num_trials)
+
+        return members, cooper_tests, indoor_trials
+
+    def build_frames(
+        self,
+        num_members: int = 50,
+        tests_per_member: Tuple[int, int] = (1, 5),
+        trials_per_member: Tuple[int, int] = (2, 8),
+        progress_callback: Optional[callable] = None,
+        workers: int = 1,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Generate all synthetic rows as DataFrames for a single bulk insert.
+
+        Member ids in the returned frames are local (1..num_members); the
+        ``member_id`` columns of the test and trial frames refer to them and are
+        offset to real ids when inserted with ``bulk_insert_frames``.
+
+        With ``workers > 1`` the members are split into contiguous shards that
+        are generated in separate processes, each seeded from this generator.
+        A seeded generator therefore reproduces the same rows for the same
+        ``workers`` count.
+
+        Args:
+            num_members: Number of members to generate
+            tests_per_member: Min and max Cooper tests per member
+            trials_per_member: Min and max indoor trials per member
+            progress_callback: Optional callback, invoked each time another
+                10,000 rows are generated (once per finished shard when
+                generating in parallel)
+            workers: Number of generator processes
+
+        Returns:
+            Members, Cooper tests and indoor trials DataFrames
+        """
+        workers = max(1, min(workers, num_members))
+
+        if workers == 1:
+            generated = 0
+
+            def report(rows: int) -> None:
+                nonlocal generated
+                previous, generated = generated, generated + rows
+                if generated // 10_000 > previous // 10_000:
+                    progress_callback(f"Generated {generated} rows")
+
+            members, cooper_tests, indoor_trials = self._generate_records(
+                1,
+                num_members,
+                tests_per_member,
+                trials_per_member,
+                report if progress_callback else None,
+            )
+        else:
+            members, cooper_tests, indoor_trials = [], [], []
+            base_seed = self.random.randrange(2**32)
+            shard_size, remainder = divmod(num_members, workers)
+
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self.locale,)
+            ) as pool:
+                futures = []
+                first_id = 1
+                for shard in range(workers):
+                    count = shard_size + (shard < remainder)
+                    futures.append(
+                        pool.submit(
+                            _generate_shard,
+                            base_seed + shard,
+                            first_id,
+                            count,
+                            tests_per_member,
+                            trials_per_member,
+                        )
+                    )
+                    first_id += count
+
+                # Collect in submission order so member ids stay sorted
+                for shard, future in enumerate(futures, start=1):
+                    shard_members, shard_tests, shard_trials = future.result()
+                    members.extend(shard_members)
+                    cooper_tests.extend(shard_tests)
+                    indoor_trials.extend(shard_trials)
+                    if progress_callback:
+                        progress_callback(f"Generated shard {shard}/{workers}")
+
+        members_df = pd.DataFrame.from_records(
+            members,
+            columns=[
+                "id",
+                "name",
+                "surname",
+                "date_of_birth",
+                "contact_info",
+                "membership_start_date",
+            ],
+        )
+        cooper_tests_df = pd.DataFrame.from_records(
+            cooper_tests,
+            columns=[
+                "member_id",
+                "test_date",
+                "diving_times",
+                "surface_times",
+                "pool_length_meters",
+                "notes",
+            ],
+        )
+        indoor_trials_df = pd.DataFrame.from_records(
+            indoor_trials,
+            columns=[
+                "member_id",
+                "trial_date",
+                "location",
+                "distance_meters",
+                "time_seconds",
+                "pool_length_meters",
+            ],
+        )
+
+        logger.info(
+            f"Built frames: {len(members_df)} members, "
+            f"{len(cooper_tests_df)} Cooper tests, {len(indoor_trials_df)} indoor trials"
+        )
+        return members_df, cooper_tests_df, indoor_trials_df
+
     def populate_database(
         self,
         num_members: int = 50,
         tests_per_member: Tuple[int, int] = (1, 5),
         trials_per_member: Tuple[int, int] = (2, 8),
         progress_callback: Optional[callable] = None,
+        workers: int = 1,
     ) -> dict:
         """
         Populate the database with synthetic data.
 
+        Rows are generated with ``build_frames`` and written with a single
+        ``bulk_insert_frames`` transaction rather than one INSERT per row.
+
         Args:
             num_members: Number of members to generate
             tests_per_member: Min and max Cooper tests per member
             trials_per_member: Min and max indoor trials per member
             progress_callback: Optional callback for progress updates
+            workers: Number of generator processes
 
         Returns:
             Dictionary with generation statistics
         """
         logger.info(f"Starting data population: {num_members} members")
 
-        stats = {
-            "members_created": 0,
-            "cooper_tests_created": 0,
-            "indoor_trials_created": 0,
-            "errors": [],
-        }
-
-        # Generate members
-        members_data = []
-        for i in range(num_members):
-            try:
-                member_data = self.generate_member()
-                skill_level = random.choices(
-                    self.skill_levels, weights=self.skill_weights
-                )[0]
-
-                # Insert member
-                member_id = insert_member(*member_data)
-                members_data.append((member_id, skill_level))
-                stats["members_created"] += 1
-
-                if progress_callback:
-                    progress_callback(
-                        f"Created member {i + 1}/{num_members}: {member_data[0]} {member_data[1]}"
-                    )
-
-            except Exception as e:
-                error_msg = f"Error creating member {i + 1}: {e}"
-                logger.error(error_msg)
-                stats["errors"].append(error_msg)
+        members_df, cooper_tests_df, indoor_trials_df = self.build_frames(
+            num_members=num_members,
+            tests_per_member=tests_per_member,
+            trials_per_member=trials_per_member,
+            progress_callback=progress_callback,
+            workers=workers,
+        )
 
-        # Generate Cooper tests
-        for member_id, skill_level in members_data:
-            num_tests = random.randint(*tests_per_member)
+        if progress_callback:
+            progress_callback("Inserting generated rows...")
+        members_created, cooper_tests_created, indoor_trials_created = (
+            bulk_insert_frames(members_df, cooper_tests_df, indoor_trials_df)
+        )
 
-            for j in range(num_tests):
-                try:
-                    test_data = self.generate_cooper_test(member_id, skill_level)
-                    insert_cooper_test(*test_data)
-                    stats["cooper_tests_created"] += 1
+        # Fold the load into the database file rather than leaving it in the WAL
+        get_db_connection().execute_query("CHECKPOINT")
 
-                    if progress_callback:
-                        progress_callback(
-                            f"Created Cooper test {j + 1}/{num_tests} for member {member_id}"
-                        )
+        stats = {
+            "members_created": members_created,
+            "cooper_tests_created": cooper_tests_created,
+            "indoor_trials_created": indoor_trials_created,
+            "errors": [],
+        }
+        logger.info(f"Data population completed: {stats}")
+        return stats
 
-                except Exception as e:
-                    error_msg = (
-                        f"Error creating Cooper test for member {member_id}: {e}"
-                    )
-                    logger.error(error_msg)
-                    stats["errors"].append(error_msg)
 
-        # Generate indoor trials
-        for member_id, skill_level in members_data:
-            num_trials = random.randint(*trials_per_member)
+# DataGenerator of a build_frames worker process, created once by _init_worker
+_worker_generator: Optional[DataGenerator] = None
 
-            for j in range(num_trials):
-                try:
-                    trial_data = self.generate_indoor_trial(member_id, skill_level)
-                    insert_indoor_trial(*trial_data)
-                    stats["indoor_trials_created"] += 1
 
-                    if progress_callback:
-                        progress_callback(
-                            f"Created indoor trial {j + 1}/{num_trials} for member {member_id}"
-                        )
+def _init_worker(locale: str) -> None:
+    """Build the worker process's DataGenerator (and its Faker) once."""
+    global _worker_generator
+    _worker_generator = DataGenerator(locale)
 
-                except Exception as e:
-                    error_msg = (
-                        f"Error creating indoor trial for member {member_id}: {e}"
-                    )
-                    logger.error(error_msg)
-                    stats["errors"].append(error_msg)
 
-        logger.info(f"Data population completed: {stats}")
-        return stats
+def _generate_shard(
+    seed: int,
+    first_id: int,
+    count: int,
+    tests_per_member: Tuple[int, int],
+    trials_per_member: Tuple[int, int],
+) -> Tuple[list, list, list]:
+    """Generate one shard of members in a worker process of ``build_frames``."""
+    # Seeds differ per shard, so shards draw independent streams
+    _worker_generator.seed(seed)
+    return _worker_generator._generate_records(
+        first_id, count, tests_per_member, trials_per_member
+    )
@@ -0,0 +1,20 @@
+"""
+Shared fixtures: every test gets its own database file as the default database.
+"""
+
+import pytest
+
+from db import clear_member_cache, connection
+from db.connection import get_db_connection
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Schema-initialized database in ``tmp_path``, used by ``get_db_connection()``."""
+    monkeypatch.setattr(connection, "DEFAULT_DB_PATH", str(tmp_path / "aqualog.duckdb"))
+    clear_member_cache()
+    database = get_db_connection()
+    database.connect()
+    yield database
+    database.close()
+    clear_member_cache()
@@ -0,0 +1,142 @@
+"""
+Tests for DatabaseConnection cursors and transactions.
+"""
+
+import gc
+import threading
+from pathlib import Path
+
+import duckdb
+import pytest
+
+
+def _cursor_in_thread(db) -> duckdb.DuckDBPyConnection:
+    """Return the cursor a short-lived thread gets from ``db``."""
+    cursors = []
+    thread = threading.Thread(target=lambda: cursors.append(db.cursor()))
+    thread.start()
+    thread.join()
+    return cursors[0]
+
+
+def test_cursor_is_reused_within_a_thread(db):
+    assert db.cursor() is db.cursor()
+
+
+def test_threads_get_their_own_cursor(db):
+    assert _cursor_in_thread(db) is not db.cursor()
+
+
+def test_cursor_is_released_when_its_thread_ends(db):
+    db.cursor()
+    for _ in range(5):
+        cursor = _cursor_in_thread(db)
+    gc.collect()
+
+    # Only the main thread's cursor is still registered
+    assert len(db._cursors) == 1
+    with pytest.raises(duckdb.ConnectionException):
+        cursor.execute("SELECT 1")
+
+
+def test_close_closes_every_cursor(db):
+    cursor = db.cursor()
+    db.close()
+
+    assert db._cursors == []
+    with pytest.raises(duckdb.ConnectionException):
+        cursor.execute("SELECT 1")
+
+    # The instance reconnects on next use
+    assert db.fetch_one("SELECT 1") == (1,)
+
+
+def test_transaction_commits(db):
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO aqualog_meta VALUES ('a', '1'), ('b', '2')")
+
+    count = db.fetch_one("SELECT COUNT(*) FROM aqualog_meta WHERE key IN ('a', 'b')")
+    assert count == (2,)
+
+
+def test_transaction_rolls_back_on_error(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO aqualog_meta VALUES ('a', '1')")
+            raise RuntimeError("boom")
+
+    assert db.fetch_one("SELECT COUNT(*) FROM aqualog_meta WHERE key = 'a'")[0] == 0
+
+    # The cursor is usable again after the rollback
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO aqualog_meta VALUES ('a', '1')")
+    assert db.fetch_one("SELECT value FROM aqualog_meta WHERE key = 'a'") == ("1",)
+
+
+def test_transaction_rolls_back_on_keyboard_interrupt(db):
+    with pytest.raises(KeyboardInterrupt):
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO aqualog_meta VALUES ('a', '1')")
+            raise KeyboardInterrupt
+
+    assert db.fetch_one("SELECT COUNT(*) FROM aqualog_meta WHERE key = 'a'")[0] == 0
+    with db.transaction():
+        pass
+
+
+def test_transaction_rolls_back_when_its_generator_is_abandoned(db):
+    def insert_rows():
+        with db.transaction() as conn:
+            for i in range(3):
+                conn.execute("INSERT INTO aqualog_meta VALUES (?, 'x')", (str(i),))
+                yield i
+
+    rows = insert_rows()
+    next(rows)
+    rows.close()
+
+    assert db.fetch_one("SELECT COUNT(*) FROM aqualog_meta WHERE value = 'x'")[0] == 0
+    with db.transaction():
+        pass
+
+
+def test_nested_transactions_are_rejected(db):
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO aqualog_meta VALUES ('a', '1')")
+        with pytest.raises(RuntimeError, match="Nested"):
+            with db.transaction():
+                pass
+
+    # The outer transaction is unaffected
+    assert db.fetch_one("SELECT value FROM aqualog_meta WHERE key = 'a'") == ("1",)
+
+
+def test_exclusive_checkpoint_with_a_single_cursor(db):
+    db.execute_query("INSERT INTO aqualog_meta VALUES ('a', '1')")
+
+    with db.exclusive_checkpoint() as exclusive:
+        assert exclusive
+        assert not Path(f"{db.db_path}.wal").exists()
+
+
+def test_exclusive_checkpoint_is_refused_while_others_can_write(db):
+    started, done = threading.Event(), threading.Event()
+
+    def hold_cursor():
+        db.cursor()
+        started.set()
+        done.wait()
+
+    thread = threading.Thread(target=hold_cursor)
+    thread.start()
+    started.wait()
+    try:
+        with db.exclusive_checkpoint() as exclusive:
+            assert not exclusive
+    finally:
+        done.set()
+        thread.join()
+
+    with db.transaction():
+        with db.exclusive_checkpoint() as exclusive:
+            assert not exclusive
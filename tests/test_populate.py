@@ -0,0 +1,50 @@
+"""
+Tests for the ``populate`` command against a real database file.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+def _run(args: list[str], db_file: Path, cwd: Path) -> subprocess.CompletedProcess:
+    """Run a Python command in a fresh process that uses ``db_file``."""
+    env = {**os.environ, "AQUALOG_DB_PATH": str(db_file), "PYTHONPATH": str(ROOT)}
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_populate_checkpoints_and_data_can_be_cleared(tmp_path):
+    """populate leaves no WAL behind and a later process can delete its rows."""
+    db_file = tmp_path / "aqualog.duckdb"
+
+    _run(
+        [str(ROOT / "scripts" / "cli.py"), "populate", "-m", "10", "-w", "1"],
+        db_file,
+        tmp_path,
+    )
+    assert db_file.exists()
+    assert not Path(f"{db_file}.wal").exists()
+
+    result = _run(
+        [
+            "-c",
+            "from db import clear_all_data, get_db_connection\n"
+            "assert clear_all_data()\n"
+            "db = get_db_connection()\n"
+            "for table in ('members', 'cooper_tests', 'indoor_trials'):\n"
+            "    print(db.fetch_one(f'SELECT COUNT(*) FROM {table}')[0])\n",
+        ],
+        db_file,
+        tmp_path,
+    )
+    assert result.stdout.split() == ["0", "0", "0"]
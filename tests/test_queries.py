@@ -0,0 +1,178 @@
+"""
+Tests for the query helpers against a temporary database.
+"""
+
+from datetime import date, time
+
+import pandas as pd
+
+from db import (
+    bulk_insert_frames,
+    clear_all_data,
+    get_database_stats,
+    get_detailed_stats,
+    get_member_by_id,
+    insert_cooper_test,
+    insert_indoor_trial,
+    insert_member,
+    queries,
+)
+
+
+def _add_member(name: str = "Ada") -> int:
+    return insert_member(name, "Lovelace", date(1990, 1, 1), None, date(2020, 1, 1))
+
+
+def test_database_stats_reflect_inserts(db):
+    assert get_database_stats().total_members == 0
+
+    _add_member()
+
+    assert get_database_stats().total_members == 1
+
+
+def test_detailed_stats_are_invalidated_by_inserts(db):
+    assert get_detailed_stats()["basic_stats"]["total_members"] == 0
+
+    _add_member()
+
+    assert get_detailed_stats()["basic_stats"]["total_members"] == 1
+
+
+def test_member_misses_are_not_cached(db):
+    assert get_member_by_id(1) is None
+
+    member_id = _add_member()
+
+    assert get_member_by_id(member_id).name == "Ada"
+
+
+def test_member_cache_is_cleared_with_the_data(db):
+    member_id = _add_member()
+    assert get_member_by_id(member_id) is not None
+
+    assert clear_all_data()
+
+    assert get_member_by_id(member_id) is None
+
+
+def test_member_lookups_return_copies(db):
+    member_id = _add_member()
+
+    get_member_by_id(member_id).name = "Changed"
+
+    assert get_member_by_id(member_id).name == "Ada"
+
+
+def test_member_cache_expires(db, monkeypatch):
+    member_id = _add_member()
+    assert get_member_by_id(member_id).name == "Ada"
+
+    # A write that bypasses the query helpers, as another process would
+    db.execute_query("UPDATE members SET name = 'Grace' WHERE id = ?", (member_id,))
+    assert get_member_by_id(member_id).name == "Ada"
+
+    monkeypatch.setattr(queries, "MEMBER_CACHE_TTL", 0.0)
+    assert get_member_by_id(member_id).name == "Grace"
+
+
+def test_bulk_insert_frames_offsets_ids_past_existing_rows(db):
+    existing = _add_member()
+    insert_cooper_test(existing, date(2024, 1, 1), [time(0, 1)], [time(0, 2)], 25)
+    insert_indoor_trial(existing, date(2024, 1, 1), None, 50, None, 25)
+
+    # Frames use local member keys starting at 1
+    members = pd.DataFrame.from_records(
+        [
+            (1, "Grace", "Hopper", date(1990, 1, 1), None, date(2021, 1, 1)),
+            (2, "Alan", "Turing", date(1990, 1, 1), None, date(2021, 1, 1)),
+        ],
+        columns=[
+            "id",
+            "name",
+            "surname",
+            "date_of_birth",
+            "contact_info",
+            "membership_start_date",
+        ],
+    )
+    cooper_tests = pd.DataFrame.from_records(
+        [(2, date(2024, 2, 1), [time(0, 1)], [time(0, 2)], 25, None)],
+        columns=[
+            "member_id",
+            "test_date",
+            "diving_times",
+            "surface_times",
+            "pool_length_meters",
+            "notes",
+        ],
+    )
+    indoor_trials = pd.DataFrame.from_records(
+        [(1, date(2024, 2, 1), None, 75, 60, 25)],
+        columns=[
+            "member_id",
+            "trial_date",
+            "location",
+            "distance_meters",
+            "time_seconds",
+            "pool_length_meters",
+        ],
+    )
+
+    assert bulk_insert_frames(members, cooper_tests, indoor_trials) == (2, 1, 1)
+
+    assert db.fetch_all("SELECT id, name FROM members ORDER BY id") == [
+        (1, "Ada"),
+        (2, "Grace"),
+        (3, "Alan"),
+    ]
+    assert db.fetch_all("SELECT id, member_id FROM cooper_tests ORDER BY id") == [
+        (1, 1),
+        (2, 3),
+    ]
+    assert db.fetch_all("SELECT id, member_id FROM indoor_trials ORDER BY id") == [
+        (1, 1),
+        (2, 2),
+    ]
+
+
+def test_bulk_insert_frames_numbers_rows_in_frame_order(db):
+    members = pd.DataFrame.from_records(
+        [(1, "Ada", "Lovelace", date(1990, 1, 1), None, date(2020, 1, 1))],
+        columns=[
+            "id",
+            "name",
+            "surname",
+            "date_of_birth",
+            "contact_info",
+            "membership_start_date",
+        ],
+    )
+    cooper_tests = pd.DataFrame(
+        columns=[
+            "member_id",
+            "test_date",
+            "diving_times",
+            "surface_times",
+            "pool_length_meters",
+            "notes",
+        ]
+    )
+    # Large enough for DuckDB to scan the frame in parallel
+    count = 500_000
+    indoor_trials = pd.DataFrame(
+        {
+            "member_id": 1,
+            "trial_date": date(2024, 1, 1),
+            "location": None,
+            "distance_meters": range(1, count + 1),
+            "time_seconds": None,
+            "pool_length_meters": 25,
+        }
+    )
+
+    bulk_insert_frames(members, cooper_tests, indoor_trials)
+
+    assert db.fetch_one(
+        "SELECT COUNT(*) FROM indoor_trials WHERE id <> distance_meters"
+    ) == (0,)
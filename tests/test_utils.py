@@ -0,0 +1,109 @@
+"""
+Tests for the database maintenance utilities.
+"""
+
+import shutil
+import threading
+from datetime import date
+from pathlib import Path
+
+import duckdb
+
+from db import (
+    backup_database,
+    export_database_schema,
+    get_db_connection,
+    get_detailed_stats,
+    insert_member,
+    utils,
+)
+
+ROOT = Path(__file__).parent.parent
+
+
+def _members_in(path) -> int:
+    with duckdb.connect(str(path), read_only=True) as conn:
+        return conn.execute("SELECT COUNT(*) FROM members").fetchone()[0]
+
+
+def test_duckdb_backup_copies_the_file(db, tmp_path):
+    insert_member("Ada", "Lovelace", date(1990, 1, 1), None, date(2020, 1, 1))
+    backup = tmp_path / "backup" / "aqualog.duckdb"
+
+    assert backup_database(str(backup))
+
+    assert _members_in(backup) == 1
+
+
+def test_duckdb_backup_copies_rows_while_other_threads_hold_cursors(
+    db, tmp_path, monkeypatch
+):
+    insert_member("Ada", "Lovelace", date(1990, 1, 1), None, date(2020, 1, 1))
+    backup = tmp_path / "backup.duckdb"
+    backup.write_bytes(b"stale")
+
+    # A live cursor in another thread rules out the byte copy
+    monkeypatch.setattr(utils, "_copy_file", None)
+    started, done = threading.Event(), threading.Event()
+
+    def hold_cursor():
+        db.cursor()
+        started.set()
+        done.wait()
+
+    thread = threading.Thread(target=hold_cursor)
+    thread.start()
+    started.wait()
+    try:
+        assert backup_database(str(backup), fmt="duckdb")
+    finally:
+        done.set()
+        thread.join()
+
+    assert _members_in(backup) == 1
+
+
+def test_parquet_backup_can_be_imported(db, tmp_path):
+    insert_member("Ada", "Lovelace", date(1990, 1, 1), None, date(2020, 1, 1))
+    backup = tmp_path / "export"
+
+    assert backup_database(str(backup))
+
+    assert (backup / "schema.sql").exists()
+    with duckdb.connect() as conn:
+        conn.execute(f"IMPORT DATABASE '{backup}'")
+        assert conn.execute("SELECT COUNT(*) FROM members").fetchone() == (1,)
+
+
+def test_backup_refuses_to_overwrite_the_database(db):
+    assert not backup_database(str(db.db_path))
+
+    assert db.fetch_one("SELECT COUNT(*) FROM members") == (0,)
+
+
+def test_schema_export_includes_views_and_can_be_replayed(db):
+    db.execute_query("CREATE VIEW member_names AS SELECT name FROM members")
+
+    schema = export_database_schema()
+
+    with duckdb.connect() as conn:
+        conn.execute(schema)
+        assert conn.execute("SELECT COUNT(*) FROM member_names").fetchone() == (0,)
+
+
+def test_detailed_stats_on_a_database_opened_read_only(tmp_path):
+    """Read-only connections skip the schema setup, so stats need only the tables."""
+    # The shipped database predates every schema change made since
+    db_file = tmp_path / "aqualog.duckdb"
+    shutil.copyfile(ROOT / "data" / "aqualog.duckdb", db_file)
+    with duckdb.connect(str(db_file), read_only=True) as conn:
+        members = conn.execute("SELECT COUNT(*) FROM members").fetchone()[0]
+
+    db = get_db_connection(str(db_file), read_only=True)
+    try:
+        stats = get_detailed_stats(db)
+    finally:
+        db.close()
+
+    assert stats["basic_stats"]["total_members"] == members
+    assert stats["member_stats"]["max_age"] > 0